@@ -9,100 +9,41 @@ import pandas as pd
 import os
 from typing import List, Dict
 
-# Mock data for demonstration
-MOCK_RFP_TEXT = """
-REQUEST FOR PROPOSAL: ENTERPRISE SOFTWARE SOLUTION
+from mock_data import (
+    MOCK_RFP_TEXT,
+    MOCK_REQUIREMENTS,
+    MOCK_VENDOR_A_EVALUATIONS,
+    MOCK_VENDOR_B_EVALUATIONS,
+)
 
-We are seeking proposals for an enterprise software solution that meets the following requirements:
+# Vendor scores aligned to MOCK_REQUIREMENTS order, so the mock matrix can be
+# built column-wise without a per-row dict lookup
+_MOCK_VENDOR_A_SCORES = [MOCK_VENDOR_A_EVALUATIONS[req] for req in MOCK_REQUIREMENTS]
+_MOCK_VENDOR_B_SCORES = [MOCK_VENDOR_B_EVALUATIONS[req] for req in MOCK_REQUIREMENTS]
+_SCORE_CATEGORIES = ["No", "Yes"]
 
-Technical Requirements:
-- Must support single sign-on (SSO) with SAML 2.0
-- Must provide REST API for integration
-- Must support multi-tenant architecture
-- Must be deployable on-premise or in the cloud
-- Must provide real-time data synchronization
-
-Security Requirements:
-- Data must be encrypted at rest using AES-256
-- Must support role-based access control (RBAC)
-- Must provide audit logging for all user actions
-- Must comply with SOC 2 Type II standards
-
-Support Requirements:
-- Must provide 24/7 technical support via phone and email
-- Must offer training and documentation
-- Must provide implementation services
-- Must offer maintenance and updates
-
-Performance Requirements:
-- Must support at least 1000 concurrent users
-- Must have 99.9% uptime SLA
-- Must provide response times under 2 seconds
-"""
-
-MOCK_REQUIREMENTS = [
-    "Must support single sign-on (SSO) with SAML 2.0",
-    "Must provide REST API for integration",
-    "Must support multi-tenant architecture",
-    "Must be deployable on-premise or in the cloud",
-    "Must provide real-time data synchronization",
-    "Data must be encrypted at rest using AES-256",
-    "Must support role-based access control (RBAC)",
-    "Must provide audit logging for all user actions",
-    "Must comply with SOC 2 Type II standards",
-    "Must provide 24/7 technical support via phone and email",
-    "Must offer training and documentation",
-    "Must provide implementation services",
-    "Must offer maintenance and updates",
-    "Must support at least 1000 concurrent users",
-    "Must have 99.9% uptime SLA",
-    "Must provide response times under 2 seconds"
-]
-
-MOCK_VENDOR_A_EVALUATIONS = {
-    "Must support single sign-on (SSO) with SAML 2.0": "Yes",
-    "Must provide REST API for integration": "Yes",
-    "Must support multi-tenant architecture": "Yes",
-    "Must be deployable on-premise or in the cloud": "Yes",
-    "Must provide real-time data synchronization": "Yes",
-    "Data must be encrypted at rest using AES-256": "Yes",
-    "Must support role-based access control (RBAC)": "Yes",
-    "Must provide audit logging for all user actions": "Yes",
-    "Must comply with SOC 2 Type II standards": "Yes",
-    "Must provide 24/7 technical support via phone and email": "Yes",
-    "Must offer training and documentation": "Yes",
-    "Must provide implementation services": "Yes",
-    "Must offer maintenance and updates": "Yes",
-    "Must support at least 1000 concurrent users": "Yes",
-    "Must have 99.9% uptime SLA": "Yes",
-    "Must provide response times under 2 seconds": "Yes"
-}
-
-MOCK_VENDOR_B_EVALUATIONS = {
-    "Must support single sign-on (SSO) with SAML 2.0": "Yes",
-    "Must provide REST API for integration": "Yes",
-    "Must support multi-tenant architecture": "Yes",
-    "Must be deployable on-premise or in the cloud": "No",
-    "Must provide real-time data synchronization": "No",
-    "Data must be encrypted at rest using AES-256": "Yes",
-    "Must support role-based access control (RBAC)": "Yes",
-    "Must provide audit logging for all user actions": "No",
-    "Must comply with SOC 2 Type II standards": "No",
-    "Must provide 24/7 technical support via phone and email": "No",
-    "Must offer training and documentation": "Yes",
-    "Must provide implementation services": "No",
-    "Must offer maintenance and updates": "Yes",
-    "Must support at least 1000 concurrent users": "No",
-    "Must have 99.9% uptime SLA": "No",
-    "Must provide response times under 2 seconds": "No"
-}
+# Static preview text and numbered requirements list, built once at import
+_MOCK_RFP_PREVIEW = MOCK_RFP_TEXT[:500] + "..."
+_MOCK_REQUIREMENTS_MD = "\n".join(f"{i}. {req}" for i, req in enumerate(MOCK_REQUIREMENTS, 1))
 
+@st.cache_data
 def create_mock_evaluation_matrix():
     """Create a mock evaluation matrix for demonstration."""
-    df = pd.DataFrame({"Requirements": MOCK_REQUIREMENTS})
-    df["Vendor A"] = df['Requirements'].map(MOCK_VENDOR_A_EVALUATIONS)
-    df["Vendor B"] = df['Requirements'].map(MOCK_VENDOR_B_EVALUATIONS)
-    return df
+    return pd.DataFrame({
+        "Requirements": MOCK_REQUIREMENTS,
+        "Vendor A": pd.Categorical(_MOCK_VENDOR_A_SCORES, categories=_SCORE_CATEGORIES),
+        "Vendor B": pd.Categorical(_MOCK_VENDOR_B_SCORES, categories=_SCORE_CATEGORIES),
+    })
+
+@st.cache_data(ttl=60)
+def load_evaluation_matrix(path: str, mtime: float) -> pd.DataFrame:
+    """Load the evaluation matrix CSV; mtime is part of the cache key so edits are picked up."""
+    return pd.read_csv(path)
+
+@st.cache_data(max_entries=8)
+def df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame for st.download_button, reusing the result for unchanged data."""
+    return df.to_csv(index=False).encode("utf-8")
 
 def main():
     st.set_page_config(
@@ -144,7 +85,7 @@ def main():
             
             # Show mock extracted text
             with st.expander("View extracted text (first 500 characters)"):
-                st.text(MOCK_RFP_TEXT[:500] + "...")
+                st.text(_MOCK_RFP_PREVIEW)
             
             st.info("Analyzing RFP and extracting requirements... (Demo mode)")
             
@@ -152,8 +93,7 @@ def main():
             st.success(f"Successfully extracted {len(MOCK_REQUIREMENTS)} requirements!")
             
             st.subheader("Extracted Requirements:")
-            for i, req in enumerate(MOCK_REQUIREMENTS, 1):
-                st.write(f"{i}. {req}")
+            st.markdown(_MOCK_REQUIREMENTS_MD)
             
             # Create evaluation matrix
             if st.button("Create Evaluation Matrix"):
@@ -166,7 +106,7 @@ def main():
                 st.dataframe(df)
                 
                 # Download button
-                csv = df.to_csv(index=False)
+                csv = df_to_csv_bytes(df)
                 st.download_button(
                     label="Download Evaluation Matrix (CSV)",
                     data=csv,
@@ -187,22 +127,24 @@ def main():
         4. The evaluation matrix will be updated with vendor scores
         """)
         
-        # Check if evaluation matrix exists
-        if not os.path.exists("evaluation_matrix.csv"):
+        # Load current evaluation matrix (one existence check per rerun)
+        current_matrix = pd.DataFrame()
+        if os.path.exists("evaluation_matrix.csv"):
+            current_matrix = load_evaluation_matrix(
+                "evaluation_matrix.csv", os.path.getmtime("evaluation_matrix.csv")
+            )
+        else:
             st.error("No evaluation matrix found! Please complete Workflow 1 first to create the evaluation matrix.")
             st.info("For demo purposes, you can create a sample matrix:")
             if st.button("Create Sample Evaluation Matrix"):
-                df = pd.DataFrame({"Requirements": MOCK_REQUIREMENTS})
-                df.to_csv("evaluation_matrix.csv", index=False)
+                # Keep the freshly written matrix instead of reading it back from disk
+                current_matrix = pd.DataFrame({"Requirements": MOCK_REQUIREMENTS})
+                current_matrix.to_csv("evaluation_matrix.csv", index=False)
                 st.success("Sample evaluation matrix created!")
         
-        # Load current evaluation matrix
-        if os.path.exists("evaluation_matrix.csv"):
-            current_matrix = pd.read_csv("evaluation_matrix.csv")
+        if not current_matrix.empty:
             st.subheader("Current Evaluation Matrix:")
             st.dataframe(current_matrix)
-        else:
-            current_matrix = pd.DataFrame()
         
         # Vendor proposal upload
         uploaded_proposal = st.file_uploader(
@@ -234,7 +176,8 @@ def main():
                 else:
                     # Generate random evaluations for demo
                     import random
-                    vendor_evaluations = {req: random.choice(["Yes", "No"]) for req in MOCK_REQUIREMENTS}
+                    scores = random.choices(["Yes", "No"], k=len(MOCK_REQUIREMENTS))
+                    vendor_evaluations = dict(zip(MOCK_REQUIREMENTS, scores))
                 
                 # Display evaluation results
                 st.subheader(f"Evaluation Results for {vendor_name}:")
@@ -246,7 +189,9 @@ def main():
                 
                 # Update evaluation matrix
                 if not current_matrix.empty:
-                    current_matrix[vendor_name] = current_matrix['Requirements'].map(vendor_evaluations)
+                    current_matrix[vendor_name] = (
+                        pd.Series(vendor_evaluations).reindex(current_matrix['Requirements']).to_numpy()
+                    )
                     current_matrix.to_csv("evaluation_matrix.csv", index=False)
                     st.success(f"Evaluation matrix updated with {vendor_name} scores!")
                     
@@ -255,7 +200,7 @@ def main():
                     st.dataframe(current_matrix)
                     
                     # Download button
-                    csv = current_matrix.to_csv(index=False)
+                    csv = df_to_csv_bytes(current_matrix)
                     st.download_button(
                         label="Download Updated Evaluation Matrix (CSV)",
                         data=csv,
@@ -264,14 +209,12 @@ def main():
                     )
     
     # Show sample final matrix
-    st.sidebar.markdown("---")
-    st.sidebar.subheader("Sample Final Matrix")
+    st.sidebar.markdown("---\n\n### Sample Final Matrix")
     sample_matrix = create_mock_evaluation_matrix()
     st.sidebar.dataframe(sample_matrix, use_container_width=True)
     
     # Footer
-    st.markdown("---")
-    st.markdown("**Note:** This is a demo version. For full functionality with Amazon Bedrock LLM, configure AWS credentials and run `streamlit run main.py`")
+    st.markdown("---\n\n**Note:** This is a demo version. For full functionality with Amazon Bedrock LLM, configure AWS credentials and run `streamlit run main.py`")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
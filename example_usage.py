@@ -6,6 +6,7 @@ This script demonstrates how to use the tool programmatically.
 
 import os
 from main import BedrockLLM, PDFProcessor, VendorEvaluator
+from mock_data import MOCK_RFP_TEXT, MOCK_VENDOR_A_PROPOSAL, MOCK_VENDOR_B_PROPOSAL
 
 def example_rfp_analysis():
     """Example of analyzing an RFP document."""
@@ -15,42 +16,13 @@ def example_rfp_analysis():
     evaluator = VendorEvaluator()
     
     # Example RFP text (in real usage, this would come from a PDF)
-    example_rfp_text = """
-    REQUEST FOR PROPOSAL: ENTERPRISE SOFTWARE SOLUTION
-    
-    We are seeking proposals for an enterprise software solution that meets the following requirements:
-    
-    Technical Requirements:
-    - Must support single sign-on (SSO) with SAML 2.0
-    - Must provide REST API for integration
-    - Must support multi-tenant architecture
-    - Must be deployable on-premise or in the cloud
-    - Must provide real-time data synchronization
-    
-    Security Requirements:
-    - Data must be encrypted at rest using AES-256
-    - Must support role-based access control (RBAC)
-    - Must provide audit logging for all user actions
-    - Must comply with SOC 2 Type II standards
-    
-    Support Requirements:
-    - Must provide 24/7 technical support via phone and email
-    - Must offer training and documentation
-    - Must provide implementation services
-    - Must offer maintenance and updates
-    
-    Performance Requirements:
-    - Must support at least 1000 concurrent users
-    - Must have 99.9% uptime SLA
-    - Must provide response times under 2 seconds
-    """
+    example_rfp_text = MOCK_RFP_TEXT
     
     print("Analyzing RFP document...")
     requirements = evaluator.analyze_rfp(example_rfp_text)
     
     print(f"\nExtracted {len(requirements)} requirements:")
-    for i, req in enumerate(requirements, 1):
-        print(f"{i}. {req}")
+    print("\n".join(f"{i}. {req}" for i, req in enumerate(requirements, 1)))
     
     # Create evaluation matrix
     evaluator.create_evaluation_matrix(requirements)
@@ -65,84 +37,25 @@ def example_vendor_evaluation(requirements):
     evaluator = VendorEvaluator()
     
     # Example vendor proposal text
-    vendor_a_proposal = """
-    VENDOR A PROPOSAL
-    
-    Technical Capabilities:
-    - We provide comprehensive SSO support including SAML 2.0 integration
-    - Our platform offers a complete REST API suite for seamless integration
-    - Multi-tenant architecture is a core feature of our solution
-    - We support both cloud and on-premise deployment options
-    - Real-time data synchronization is available through our platform
-    
-    Security Features:
-    - All data is encrypted using AES-256 encryption at rest
-    - We implement comprehensive RBAC with granular permissions
-    - Complete audit logging is provided for compliance
-    - Our solution is SOC 2 Type II certified
-    
-    Support Services:
-    - 24/7 technical support available via phone and email
-    - Comprehensive training programs and documentation
-    - Professional implementation services included
-    - Regular maintenance and updates provided
+    vendor_a_proposal = MOCK_VENDOR_A_PROPOSAL
+    vendor_b_proposal = MOCK_VENDOR_B_PROPOSAL
     
-    Performance:
-    - Supports up to 2000 concurrent users
-    - 99.95% uptime SLA guaranteed
-    - Average response time of 1.5 seconds
-    """
-    
-    vendor_b_proposal = """
-    VENDOR B PROPOSAL
-    
-    Technical Capabilities:
-    - SSO support with SAML 2.0 available
-    - REST API provided for integrations
-    - Multi-tenant architecture supported
-    - Cloud deployment only (no on-premise option)
-    - Batch data processing (not real-time)
-    
-    Security Features:
-    - AES-256 encryption for data at rest
-    - Basic role-based access control
-    - Limited audit logging capabilities
-    - Working towards SOC 2 compliance
-    
-    Support Services:
-    - Business hours support only (8 AM - 6 PM EST)
-    - Basic documentation provided
-    - Self-service implementation
-    - Quarterly updates
-    
-    Performance:
-    - Supports up to 500 concurrent users
-    - 99% uptime SLA
-    - Response times vary (2-5 seconds)
-    """
-    
-    # Evaluate Vendor A
-    print("Evaluating Vendor A proposal...")
-    vendor_a_evaluations = evaluator.evaluate_vendor_proposal(
-        vendor_a_proposal, requirements, "Vendor A"
+    # Evaluate both vendors concurrently
+    print("Evaluating Vendor A and Vendor B proposals...")
+    results = evaluator.evaluate_vendor_proposals(
+        [("Vendor A", vendor_a_proposal), ("Vendor B", vendor_b_proposal)], requirements
     )
     
-    # Evaluate Vendor B
-    print("Evaluating Vendor B proposal...")
-    vendor_b_evaluations = evaluator.evaluate_vendor_proposal(
-        vendor_b_proposal, requirements, "Vendor B"
+    # Update evaluation matrix (one write for both vendors)
+    final_matrix = evaluator.update_evaluation_matrix_multi(
+        {vendor_name: vendor_evaluations for vendor_name, (vendor_evaluations, _response) in results.items()}
     )
     
-    # Update evaluation matrix
-    evaluator.update_evaluation_matrix(vendor_a_evaluations, "Vendor A")
-    evaluator.update_evaluation_matrix(vendor_b_evaluations, "Vendor B")
-    
     # Display results
-    final_matrix = evaluator.get_evaluation_matrix()
     print("\nFinal Evaluation Matrix:")
     print(final_matrix.to_string(index=False))
     
-    return final_matrix
+    return final_matrix, evaluator
 
 def main():
     """Run the example workflow."""
@@ -154,7 +67,7 @@ def main():
         requirements = example_rfp_analysis()
         
         # Step 2: Evaluate vendors
-        final_matrix = example_vendor_evaluation(requirements)
+        final_matrix, evaluator = example_vendor_evaluation(requirements)
         
         print("\n" + "=" * 50)
         print("Example completed successfully!")
@@ -167,11 +80,16 @@ def main():
             print(f"- Total requirements: {len(final_matrix)}")
             print(f"- Vendors evaluated: {len(vendors)}")
             
-            for vendor in vendors:
-                yes_count = (final_matrix[vendor] == 'Yes').sum()
+            if vendors:
+                # Count all vendor columns in one column-wise reduction; cells hold
+                # "Yes - <explanation>", and header rows hold "N/A" (NaN once read back)
                 total = len(final_matrix)
-                percentage = (yes_count / total) * 100
-                print(f"- {vendor}: {yes_count}/{total} requirements met ({percentage:.1f}%)")
+                yes_counts = final_matrix[vendors].apply(lambda column: column.astype("string").str.startswith("Yes -")).sum()
+                percentages = yes_counts / total * 100
+                print("\n".join(
+                    f"- {vendor}: {yes_counts[vendor]}/{total} requirements met ({percentages[vendor]:.1f}%)"
+                    for vendor in vendors
+                ))
         
     except Exception as e:
         print(f"Error running example: {e}")
@@ -1,12 +1,27 @@
 import streamlit as st
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import json
 import pandas as pd
-import PyPDF2
+try:
+    import pymupdf
+except ImportError:  # PyMuPDF is optional; fall back to PyPDF2 for text extraction
+    pymupdf = None
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library json module
+    orjson = None
 import io
 import os
-from typing import List, Dict
+import hashlib
+import tempfile
+import threading
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import List, Dict, Tuple, Optional, Iterator, Iterable, Callable, Generator
 import re
+from collections import Counter
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -15,147 +30,735 @@ load_dotenv()
 # Configuration - load from environment variables
 AWS_REGION = os.getenv("AWS_DEFAULT_REGION", "us-west-2")
 MODEL_ID = os.getenv("BEDROCK_MODEL_ID", "anthropic.claude-3-5-sonnet-20241022-v2:0")
+# Upper bound on concurrent Bedrock calls per process, to stay within account throughput
+# limits; enforced by the shared BedrockLLM however many worker threads are running
+MAX_CONCURRENT_EVALUATIONS = int(os.getenv("BEDROCK_MAX_CONCURRENCY", "5"))
+# Attempts per Bedrock call, including retries of throttled or transient failures
+BEDROCK_MAX_ATTEMPTS = int(os.getenv("BEDROCK_MAX_ATTEMPTS", "8"))
+# On-disk cache of Bedrock responses; set LLM_CACHE_DIR to an empty string to disable
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", ".llm_cache")
+# RFPs longer than this many characters (~25k tokens) are analyzed in overlapping chunks
+RFP_CHUNK_CHARS = int(os.getenv("RFP_CHUNK_CHARS", "100000"))
+# Characters shared by neighbouring chunks; split_text caps it at a quarter of the chunk size
+RFP_CHUNK_OVERLAP = 2000
+# PDFs with at least this many pages have their text extracted in several processes
+PDF_PARALLEL_MIN_PAGES = 500
+# Longest proposal text sent for evaluation (~150k tokens, leaving room in a 200k-token
+# context for the rubric and requirements); later pages are not extracted
+PROPOSAL_MAX_CHARS = int(os.getenv("PROPOSAL_MAX_CHARS", "600000"))
+# Extracted PDF texts remembered per browser session, keyed by upload id
+PDF_TEXT_SESSION_ENTRIES = 16
+# Parsed RFP requirement lists kept across reruns and sessions
+RFP_ANALYSIS_ENTRIES = 32
+# Output budget of one evaluation call, and per requirement (a JSON item with a 2-3
+# sentence explanation); 500 more tokens cover the price and the tool-call framing
+EVAL_MAX_TOKENS = 4000
+EVAL_TOKENS_PER_REQUIREMENT = 150
+# Most requirements scored in one evaluation call, capped so a full batch fits within
+# EVAL_MAX_TOKENS; larger matrices are split into batches
+EVAL_BATCH_SIZE = max(1, min(int(os.getenv("EVAL_BATCH_SIZE", "20")),
+                             (EVAL_MAX_TOKENS - 500) // EVAL_TOKENS_PER_REQUIREMENT))
+# Seconds a successful or failed AWS credentials check is reused before calling STS again
+CREDENTIALS_CHECK_TTL = int(os.getenv("CREDENTIALS_CHECK_TTL", "300"))
+
+# Model families that accept Anthropic prompt-caching checkpoints on Bedrock
+PROMPT_CACHING_MODELS = (
+    "claude-3-5-sonnet-20241022-v2",
+    "claude-3-5-haiku",
+    "claude-3-7-sonnet",
+    "claude-sonnet-4",
+    "claude-opus-4",
+)
+# Stop reasons of a finished response; truncated ("max_tokens") output is never cached
+COMPLETE_STOP_REASONS = ("end_turn", "tool_use")
+
+# One line of a free-text requirements list: a **Category** header, a -/•/* bullet,
+# or plain text; surrounding whitespace is excluded from each group
+REQUIREMENT_LINE_RE = re.compile(
+    r"^[^\S\n]*(?:(?P<header>\*\*.*\*\*|\*\*\*?)|[-•*][^\S\n]*(?P<bullet>.*?)|(?P<text>\S.*?))[^\S\n]*$",
+    re.MULTILINE,
+)
+
+# Page furniture that carries no requirements: "Page 3", "Page 3 of 40", "- 3 -" and
+# table-of-contents entries with dot leaders ("Scope of Work ........ 12")
+BOILERPLATE_LINE_RE = re.compile(
+    r"^[^\S\n]*(?:page[^\S\n]+\d+(?:[^\S\n]+of[^\S\n]+\d+)?|-[^\S\n]*\d+[^\S\n]*-|.*?\.{4,}[^\S\n]*\d+)[^\S\n]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Runs of blank (or whitespace-only) lines left behind by PDF extraction
+BLANK_LINES_RE = re.compile(r"\n(?:[^\S\n]*\n){2,}")
+
+# "--- ... ---" rows in an evaluation: category headers, plus the price and scoring rows
+SECTION_ROW_RE = re.compile(r"^(?=---).*(?<=---)\Z", re.DOTALL)
+SUMMARY_ROW_RE = re.compile(r"PRICE INFORMATION|SCORING SUMMARY")
+
+# Outermost {...} span in a model response, for pulling JSON out of surrounding prose
+JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Static instructions for requirements extraction, sent as the cached system prompt
+RFP_ANALYSIS_INSTRUCTIONS = """
+You are an expert procurement analyst. Your task is to analyze the Request for Proposal (RFP) document provided in the user message and extract high-level, generalized evaluation criteria that can be used to fairly compare multiple vendor proposals.
+
+**IMPORTANT:** Focus on broad, general requirements rather than specific implementation details. The goal is to create evaluation criteria that multiple vendors can reasonably be expected to address, not to create overly specific technical specifications.
+
+Please structure your analysis using the following categories. For each category, identify 2-5 high-level, generalized requirements that capture the essential needs without being overly specific.
+
+**Categories to Use:**
+
+* **Functional Requirements:** (What the system must do - focus on capabilities, not specific features)
+* **Technical Requirements:** (How the system must be built - focus on architecture and integration needs, not specific technologies)
+* **Security & Compliance:** (Security and regulatory requirements - focus on standards and certifications, not specific implementations)
+* **Support & Service Level Agreements (SLAs):** (Support and service requirements - focus on availability and response times)
+* **Project Management & Implementation:** (Implementation process requirements - focus on methodology and timeline)
+* **Pricing & Contractual Terms:** (Pricing and contract requirements - focus on structure and terms)
+
+**Guidelines for Requirements:**
+- Make requirements **general and flexible** enough that multiple vendors can address them
+- Focus on **what** needs to be accomplished, not **how** it should be done
+- Avoid overly specific technical details, brand names, or implementation specifics
+- Use broad, inclusive language that allows for different approaches
+- Focus on **outcomes and capabilities** rather than specific features
+
+**Examples of Good vs Bad Requirements:**
+
+❌ **Too Specific:** "Must use Oracle Database 19c with Real Application Clusters"
+✅ **Generalized:** "Must provide enterprise-grade database capabilities with high availability"
+
+❌ **Too Specific:** "Must integrate with SAP ERP version 4.0"
+✅ **Generalized:** "Must integrate with existing enterprise resource planning systems"
+
+❌ **Too Specific:** "Must provide 99.99% uptime with 15-minute response time"
+✅ **Generalized:** "Must provide high availability with defined service level agreements"
+
+Focus on requirements that are broad enough for fair vendor comparison while still being specific enough to evaluate meaningfully.
+
+**Output Format:**
+Return a single JSON object and no other text, with one entry per category in this shape:
+
+{"categories": [
+    {"name": "Functional Requirements", "requirements": [
+        "Must provide comprehensive user management and access control capabilities",
+        "Must support automated workflow and approval processes",
+        "Must offer reporting and analytics functionality"
+    ]},
+    {"name": "Technical Requirements", "requirements": [
+        "Must integrate with existing enterprise systems and databases",
+        "Must provide secure, scalable architecture suitable for enterprise deployment",
+        "Must support web-based access with mobile compatibility"
+    ]}
+]}
+"""
+
+# Static scoring rubric for vendor evaluation, sent as the cached system prompt
+VENDOR_EVALUATION_RUBRIC = """
+You are an expert procurement analyst. Your task is to conduct a detailed evaluation of a vendor's proposal against a provided list of RFP requirements. You must be strict, objective, and avoid making assumptions. If information is not present, you must say so.
+
+The requirements to evaluate against and the vendor proposal content are provided in the user message.
+
+For each requirement, provide a detailed evaluation with the following format:
+
+**Evaluation Format:**
+For each requirement, respond with:
+1. **Assessment**: "Yes", "No", or "Not Sure"
+2. **Explanation**: 2-3 sentences explaining your assessment
+
+**Assessment Criteria:**
+- **Yes**: The proposal clearly and specifically addresses the requirement with sufficient detail
+- **No**: The requirement is not mentioned, is vague, or lacks sufficient detail
+- **Not Sure**: The proposal mentions something related but it's unclear if it fully meets the requirement
+
+**Important Guidelines:**
+- Be strict and objective - do not make assumptions
+- If information is not present, say "Not Sure" and explain why
+- Do not create or infer information that is not explicitly stated
+- Provide specific evidence from the proposal to support your assessment
+- Keep explanations concise but informative (2-3 sentences max)
+
+**Response Format:**
+When the submit_evaluation tool is available, submit the same evaluations and pricing through it. Otherwise, provide your evaluation in this exact format:
+
+Requirement 1: [Yes/No/Not Sure] - [2-3 sentence explanation]
+Requirement 2: [Yes/No/Not Sure] - [2-3 sentence explanation]
+...and so on for each requirement
+
+**Price Information:**
+After your evaluations, extract and provide pricing information from the proposal:
+- Look for total project cost, implementation cost, annual fees, or any pricing details
+- If multiple pricing options are provided, include all relevant pricing information
+- If no pricing information is found, state "No pricing information found in proposal"
+- Format: "Total Project Cost: [amount]" or "Implementation Cost: [amount], Annual Fee: [amount]" etc.
+
+**Scoring Information:**
+After your evaluations, provide a summary:
+- Total Yes responses: [count]
+- Total No responses: [count] 
+- Total Not Sure responses: [count]
+- Score: [Yes count × 1 + Not Sure count × 0.5] out of [total requirements]
+"""
+
+# Tool the evaluation call is forced to use, so verdicts come back as JSON rather than
+# free text; the text parser remains as a fallback
+EVALUATION_TOOL = {
+    "name": "submit_evaluation",
+    "description": "Submit the assessment of every numbered requirement and the proposal's pricing.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "evaluations": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "requirement_number": {"type": "integer", "description": "Number of the requirement in the list"},
+                        "assessment": {"type": "string", "enum": ["Yes", "No", "Not Sure"]},
+                        "explanation": {"type": "string", "description": "2-3 sentences of evidence from the proposal"},
+                    },
+                    "required": ["requirement_number", "assessment", "explanation"],
+                },
+            },
+            "price_information": {
+                "type": "string",
+                "description": 'Pricing from the proposal, or "No pricing information found in proposal"',
+            },
+        },
+        "required": ["evaluations", "price_information"],
+    },
+}
+
+def dumps_json(obj, sort_keys: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    # Compact separators match orjson's output, so cache keys agree with or without it
+    return json.dumps(obj, sort_keys=sort_keys, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def loads_json(data):
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def complete_json_array_items(text: str, key: str) -> List:
+    """Return the items of the "key": [...] array in text that arrived whole.
+    
+    For JSON cut off part-way, e.g. tool input truncated at the output limit;
+    the partial item at the cut is dropped.
+    """
+    match = re.search(r'"%s"\s*:\s*\[' % re.escape(key), text)
+    if not match:
+        return []
+    decoder = json.JSONDecoder()
+    items = []
+    position = match.end()
+    while True:
+        while position < len(text) and text[position] in " \t\r\n,":
+            position += 1
+        if position >= len(text) or text[position] == "]":
+            return items
+        try:
+            item, position = decoder.raw_decode(text, position)
+        except ValueError:
+            return items
+        items.append(item)
+
+def strip_boilerplate(text: str) -> str:
+    """Drop page numbers and table-of-contents lines and collapse blank-line runs.
+    
+    Only removes text that cannot hold a requirement, to save prompt tokens.
+    """
+    text = BOILERPLATE_LINE_RE.sub("", text)
+    return BLANK_LINES_RE.sub("\n\n", text)
+
+def split_text(text: str, chunk_size: int, overlap: int) -> List[str]:
+    """Split text into chunks of at most chunk_size characters, overlapping by overlap.
+    
+    Chunk ends are moved back to the last line break where possible so lines
+    (and usually requirements) are not cut in half. The overlap is capped at a
+    quarter of chunk_size so each chunk advances by at least three quarters.
+    """
+    overlap = min(overlap, chunk_size // 4)
+    if len(text) <= chunk_size:
+        return [text]
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(start + chunk_size, len(text))
+        if end < len(text):
+            line_break = text.rfind("\n", start + overlap + 1, end)
+            if line_break != -1:
+                end = line_break
+        chunks.append(text[start:end])
+        if end >= len(text):
+            break
+        start = end - overlap
+    return chunks
+
+def merge_requirement_lists(requirement_lists: List[List[str]]) -> List[str]:
+    """Merge several "**Category**"-headed requirement lists, grouping by category.
+    
+    Repeated requirements (e.g. from overlapping RFP chunks, or listed under two
+    categories) are kept once, at their first occurrence, comparing case- and
+    whitespace-insensitively. Matrix rows are keyed by requirement text, so
+    duplicates would otherwise collide there too.
+    """
+    categories: Dict[str, Dict[str, str]] = {}
+    seen = set()
+    for requirements in requirement_lists:
+        current = None
+        for item in requirements:
+            if item.startswith('**') and item.endswith('**'):
+                current = categories.setdefault(item, {})
+            elif current is not None:
+                key = " ".join(item.lower().split())
+                if key not in seen:
+                    seen.add(key)
+                    current[key] = item
+    
+    merged = []
+    for header, reqs in categories.items():
+        if reqs:
+            merged.append(header)
+            merged.extend(reqs.values())
+    return merged
+
+class LLMCache:
+    """Exact-match cache of complete model responses, one JSON file per request payload."""
+    
+    def __init__(self, cache_dir: str = LLM_CACHE_DIR, memory_entries: int = 256):
+        self.cache_dir = cache_dir
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        # Recent responses kept in memory so repeat hits skip the file read and parse
+        self.memory_entries = memory_entries
+        self._memory: Dict[str, Tuple[str, str]] = {}
+        self._memory_lock = threading.Lock()  # evaluations run on a thread pool
+    
+    @staticmethod
+    def make_key(model_id: str, payload: Dict) -> str:
+        """Hash the model and full request payload into a stable cache key."""
+        return hashlib.sha256(dumps_json([model_id, payload], sort_keys=True)).hexdigest()
+    
+    def get(self, key: str) -> Optional[Tuple[str, str]]:
+        """Return the cached (text, stop_reason) for key, or None on a miss."""
+        if not self.cache_dir:
+            return None
+        entry = self._memory.get(key)
+        if entry is not None:
+            return entry
+        try:
+            with open(os.path.join(self.cache_dir, f"{key}.json"), "rb") as f:
+                data = loads_json(f.read())
+            # Files written before stop reasons were recorded may hold truncated
+            # responses; they lack the key and are treated as misses
+            entry = (data["text"], data["stop_reason"])
+        except (OSError, ValueError, KeyError):
+            return None
+        self._remember(key, entry)
+        return entry
+    
+    def _remember(self, key: str, entry: Tuple[str, str]):
+        """Keep an entry in the in-memory layer, evicting the oldest entry when full."""
+        with self._memory_lock:
+            if len(self._memory) >= self.memory_entries:
+                self._memory.pop(next(iter(self._memory)), None)
+            self._memory[key] = entry
+    
+    def set(self, key: str, text: str, stop_reason: str):
+        """Store a response; written to a temp file first so readers never see partial JSON."""
+        if not self.cache_dir:
+            return
+        self._remember(key, (text, stop_reason))
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(dumps_json({"text": text, "stop_reason": stop_reason}))
+            os.replace(tmp_path, os.path.join(self.cache_dir, f"{key}.json"))
+        except OSError:
+            pass
+
+@st.cache_resource(show_spinner=False)
+def get_bedrock_runtime(region_name: str = AWS_REGION):
+    """Create the bedrock-runtime client once per process; boto3 clients are thread-safe."""
+    # Create session with credentials from environment variables
+    session = boto3.Session(
+        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+        aws_session_token=os.getenv("AWS_SESSION_TOKEN"),  # Handle session token
+        region_name=region_name
+    )
+    # Adaptive retry mode backs off exponentially with jitter on ThrottlingException and
+    # also rate-limits the client, which concurrent evaluations can trigger. BedrockLLM
+    # keeps at most MAX_CONCURRENT_EVALUATIONS calls in flight, so the connection pool
+    # only needs that many; long generations need more than botocore's 60 s default
+    # read timeout.
+    config = Config(
+        retries={"total_max_attempts": BEDROCK_MAX_ATTEMPTS, "mode": "adaptive"},
+        connect_timeout=5,
+        read_timeout=300,
+        max_pool_connections=max(10, MAX_CONCURRENT_EVALUATIONS),
+    )
+    return session.client("bedrock-runtime", region_name=region_name, config=config)
 
 class BedrockLLM:
     def __init__(self, region_name: str = AWS_REGION, model_id: str = MODEL_ID):
-        # Create session with credentials from environment variables
-        self.session = boto3.Session(
-            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-            aws_session_token=os.getenv("AWS_SESSION_TOKEN"),  # Handle session token
-            region_name=region_name
-        )
-        self.client = self.session.client("bedrock-runtime", region_name=region_name)
+        self.client = get_bedrock_runtime(region_name)
         self.model_id = model_id
+        self.prompt_caching = any(name in model_id for name in PROMPT_CACHING_MODELS)
+        self.cache = LLMCache()
+        # Vendor evaluations, their requirement batches and RFP chunks all run on thread
+        # pools; each call holds a slot so the total in flight stays within the limit
+        self._call_slots = threading.BoundedSemaphore(MAX_CONCURRENT_EVALUATIONS)
+    
+    def _text_block(self, text: str, cache_checkpoint: bool = False) -> Dict:
+        """Build a text content block, marked as a prompt-cache checkpoint if requested and supported."""
+        block = {"type": "text", "text": text}
+        if cache_checkpoint and self.prompt_caching:
+            block["cache_control"] = {"type": "ephemeral"}
+        return block
     
-    def call_model(self, message: str, max_tokens: int = 4000) -> str:
-        """Call the Bedrock model with a given message."""
+    def _build_payload(self, message: str, max_tokens: int, cached_prefix: str, system: str,
+                       temperature: Optional[float], tool: Optional[Dict] = None) -> Dict:
+        """Build the Anthropic messages request body shared by call_model and stream_model."""
+        content = message
+        if cached_prefix:
+            content = [self._text_block(cached_prefix, cache_checkpoint=True), self._text_block(message)]
+        
         payload = {
             "anthropic_version": "bedrock-2023-05-31",
             "max_tokens": max_tokens,
-            "messages": [{"role": "user", "content": message}],
+            "messages": [{"role": "user", "content": content}],
         }
+        if system:
+            payload["system"] = [self._text_block(system, cache_checkpoint=True)]
+        if temperature is not None:
+            payload["temperature"] = temperature
+        if tool is not None:
+            payload["tools"] = [tool]
+            payload["tool_choice"] = {"type": "tool", "name": tool["name"]}
+        return payload
+    
+    def _store(self, cache_key: str, text: str, stop_reason: Optional[str]):
+        """Cache a finished response; empty or truncated ones are left to be retried."""
+        if text and stop_reason in COMPLETE_STOP_REASONS:
+            self.cache.set(cache_key, text, stop_reason)
+    
+    def _invoke(self, payload: Dict, stream: bool = False) -> Dict:
+        """Send payload to the model, streaming the response if asked.
         
+        If the model or region rejects the request while prompt-cache checkpoints
+        are in use, it is retried once without them; when that succeeds,
+        checkpoints are no longer sent on later calls.
+        """
+        invoke = self.client.invoke_model_with_response_stream if stream else self.client.invoke_model
         try:
-            response = self.client.invoke_model(
-                modelId=self.model_id,
-                body=json.dumps(payload)
-            )
-            response_body = json.loads(response["body"].read())
-            return response_body["content"][0]["text"]
-        except Exception as e:
-            st.error(f"Error calling Bedrock model: {str(e)}")
-            return ""
+            return invoke(modelId=self.model_id, body=dumps_json(payload))
+        except ClientError as e:
+            if not self.prompt_caching or e.response.get("Error", {}).get("Code") != "ValidationException":
+                raise
+            response = invoke(modelId=self.model_id, body=dumps_json(self._without_cache_control(payload)))
+            self.prompt_caching = False
+            return response
+    
+    @staticmethod
+    def _without_cache_control(payload: Dict) -> Dict:
+        """Return a copy of payload with every cache_control marker removed."""
+        payload = loads_json(dumps_json(payload))
+        blocks = list(payload.get("system", []))
+        for message in payload["messages"]:
+            if isinstance(message["content"], list):
+                blocks.extend(message["content"])
+        for block in blocks:
+            block.pop("cache_control", None)
+        return payload
+    
+    def call_model(self, message: str, max_tokens: int = 4000, cached_prefix: str = "", system: str = "",
+                   temperature: Optional[float] = None, tool: Optional[Dict] = None) -> str:
+        """Call the Bedrock model with a given message.
+        
+        A system prompt and a cached_prefix (sent as its own content block ahead of
+        the message) are each marked, on models that support it, as a prompt-cache
+        checkpoint so repeated calls sharing them are billed and served as cache
+        reads. temperature is left at the model default unless given. With a tool,
+        the model is made to call it and the tool input is returned as a JSON string.
+        Bedrock errors are raised; callers on worker threads hand them back to the
+        script thread to display.
+        """
+        payload = self._build_payload(message, max_tokens, cached_prefix, system, temperature, tool)
+        
+        # Identical requests (re-uploaded RFPs, re-scored proposals) are served from disk
+        cache_key = self.cache.make_key(self.model_id, payload)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached[0]
+        
+        with self._call_slots:
+            response = self._invoke(payload)
+            response_body = loads_json(response["body"].read())
+        text = self._response_text(response_body["content"])
+        self._store(cache_key, text, response_body.get("stop_reason"))
+        return text
+    
+    @staticmethod
+    def _response_text(content: List[Dict]) -> str:
+        """Return the first tool call's input as JSON, or else the first text block."""
+        for block in content:
+            if block.get("type") == "tool_use":
+                return dumps_json(block["input"]).decode("utf-8")
+        return content[0]["text"]
+    
+    def stream_model(self, message: str, max_tokens: int = 4000, cached_prefix: str = "", system: str = "",
+                     temperature: Optional[float] = None, tool: Optional[Dict] = None) -> Generator[str, None, Optional[str]]:
+        """Like call_model, but yield the response text as it is generated.
+        
+        With a tool, the tool input JSON is yielded as it is generated instead.
+        Cache hits are yielded in one piece; a completed stream is cached like call_model.
+        The generator returns the stop reason (e.g. "max_tokens" when the output was
+        cut off); Bedrock errors are raised as in call_model.
+        """
+        payload = self._build_payload(message, max_tokens, cached_prefix, system, temperature, tool)
+        
+        cache_key = self.cache.make_key(self.model_id, payload)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            yield cached[0]
+            return cached[1]
+        
+        # The slot is held until the stream is read to the end (or abandoned)
+        with self._call_slots:
+            response = self._invoke(payload, stream=True)
+            parts = []
+            stop_reason = None
+            for event in response["body"]:
+                chunk = loads_json(event["chunk"]["bytes"])
+                if chunk["type"] == "message_delta":
+                    stop_reason = chunk["delta"].get("stop_reason") or stop_reason
+                if chunk["type"] != "content_block_delta":
+                    continue
+                delta = chunk["delta"]
+                text = delta.get("partial_json", "") if tool is not None else delta.get("text", "")
+                if text:
+                    parts.append(text)
+                    yield text
+            self._store(cache_key, "".join(parts), stop_reason)
+            return stop_reason
+
+@st.cache_resource(show_spinner=False)
+def get_bedrock_llm() -> BedrockLLM:
+    """Share one BedrockLLM (client and response cache) across reruns and sessions."""
+    return BedrockLLM()
+
+def iter_pdf_pages(pdf_bytes: bytes, use_pymupdf: bool = True) -> Iterator[str]:
+    """Yield the text of each PDF page in order, loading pages one at a time."""
+    if use_pymupdf and pymupdf is not None:
+        # MuPDF extracts text in C, far faster than PyPDF2 on large documents
+        with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+            for page_number in range(doc.page_count):
+                yield doc.load_page(page_number).get_text("text")
+    else:
+        # PyPDF2 is only the fallback, so it is imported on first use (~80 ms saved at startup)
+        import PyPDF2
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+        for page in pdf_reader.pages:
+            yield page.extract_text()
+
+def extract_pages_in_processes(pdf_bytes: bytes, page_count: int, max_chars: int = 0) -> List[str]:
+    """Extract page texts with MuPDF across worker processes, one page range each.
+    
+    With max_chars, each worker stops once its own range has that many characters.
+    """
+    # PyMuPDF is not thread-safe, so parallel extraction needs separate processes
+    from pdf_pages import extract_page_range
+    
+    workers = min(os.cpu_count() or 1, 8)
+    step = -(-page_count // workers)
+    starts = list(range(0, page_count, step))
+    stops = [min(start + step, page_count) for start in starts]
+    # spawn rather than fork: forking the multi-threaded Streamlit server is unsafe
+    with ProcessPoolExecutor(max_workers=len(starts), mp_context=multiprocessing.get_context("spawn")) as executor:
+        page_ranges = executor.map(extract_page_range, [pdf_bytes] * len(starts), starts, stops,
+                                   [max_chars] * len(starts))
+        return [text for page_range in page_ranges for text in page_range]
+
+def join_pages(pages: Iterable[str], max_chars: int = 0) -> str:
+    """Join page texts, skipping pages with no text (e.g. scanned images).
+    
+    With max_chars, stops reading pages once that many characters are collected
+    and truncates to exactly max_chars.
+    """
+    parts = []
+    total = 0
+    for page_text in pages:
+        if not page_text or page_text.isspace():
+            continue
+        parts.append(page_text)
+        total += len(page_text) + 1
+        if max_chars and total >= max_chars:
+            break
+    text = "\n".join(parts)
+    return text[:max_chars] if max_chars else text
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def extract_text_from_pdf_bytes(pdf_bytes: bytes, max_chars: int = 0) -> str:
+    """Extract text content from raw PDF bytes, memoized on the bytes across reruns.
+    
+    max_chars, if set, bounds the text returned. Pages are read in order until the
+    limit is reached; a PDF large enough to be split across processes gets the same
+    budget per page range, so each worker stops early but every range is started.
+    Errors are raised rather than reported here, so a failure is not memoized.
+    """
+    try:
+        if pymupdf is not None and (os.cpu_count() or 1) > 1:
+            with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+                page_count = doc.page_count
+            if page_count >= PDF_PARALLEL_MIN_PAGES:
+                return join_pages(extract_pages_in_processes(pdf_bytes, page_count, max_chars), max_chars)
+        return join_pages(iter_pdf_pages(pdf_bytes), max_chars)
+    except Exception:
+        if pymupdf is None:
+            raise
+        # Retry files MuPDF cannot read with PyPDF2 before giving up
+        return join_pages(iter_pdf_pages(pdf_bytes, use_pymupdf=False), max_chars)
 
 class PDFProcessor:
     @staticmethod
-    def extract_text_from_pdf(pdf_file) -> str:
-        """Extract text content from a PDF file."""
+    def extract_text_from_pdf(pdf_file, max_chars: int = 0) -> str:
+        """Extract text content from a PDF file, optionally capped at max_chars."""
+        # An upload keeps its file_id across reruns, so look the text up by id in the
+        # session before hashing megabytes of PDF for the content-keyed cache
+        file_id = getattr(pdf_file, "file_id", None)
+        texts = st.session_state.setdefault("pdf_text_by_file_id", {}) if file_id else {}
+        if (file_id, max_chars) in texts:
+            return texts[(file_id, max_chars)]
+        
+        pdf_bytes = pdf_file.getvalue() if hasattr(pdf_file, "getvalue") else pdf_file.read()
         try:
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text
+            text = extract_text_from_pdf_bytes(pdf_bytes, max_chars)
         except Exception as e:
             st.error(f"Error extracting text from PDF: {str(e)}")
             return ""
+        if file_id and text:
+            if len(texts) >= PDF_TEXT_SESSION_ENTRIES:
+                texts.pop(next(iter(texts)))  # drop the oldest upload
+            texts[(file_id, max_chars)] = text
+        return text
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def load_evaluation_matrix(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Parse the matrix CSV once per file version; mtime_ns is part of the cache key."""
+    return pd.read_csv(path)
 
 class VendorEvaluator:
     def __init__(self):
-        self.llm = BedrockLLM()
+        self.llm = get_bedrock_llm()
         self.pdf_processor = PDFProcessor()
         self.evaluation_matrix_file = "evaluation_matrix.csv"
+        # In-memory copy of the matrix and the file mtime it was read/written at
+        self._matrix = None
+        self._matrix_mtime = None
+    
+    def analyze_rfp(self, rfp_text: str, show_progress: bool = False) -> List[str]:
+        """Analyze RFP and extract requirements using Bedrock LLM.
+        
+        With show_progress, the model output of a single-chunk RFP is streamed into
+        the page as it is generated. Bedrock errors are shown with st.error, and a
+        chunk whose call failed contributes no requirements.
+        """
+        rfp_text = strip_boilerplate(rfp_text)
+        chunks = split_text(rfp_text, RFP_CHUNK_CHARS, RFP_CHUNK_OVERLAP)
+        if len(chunks) == 1:
+            try:
+                requirements = self._extract_requirements(rfp_text, show_progress)
+            except Exception as e:
+                st.error(f"Error calling Bedrock model: {str(e)}")
+                requirements = []
+            # Merging a single list still drops duplicates, each of which would cost
+            # an extra verdict in every vendor evaluation
+            return merge_requirement_lists([requirements])
+        
+        # Very long RFPs: extract from each chunk in parallel, then merge by category.
+        # Workers never touch Streamlit; their errors are shown here, once each
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_EVALUATIONS, len(chunks))) as executor:
+            futures = [executor.submit(self._extract_requirements, chunk) for chunk in chunks]
+        chunk_requirements = []
+        errors = []
+        for future in futures:
+            try:
+                chunk_requirements.append(future.result())
+            except Exception as e:
+                errors.append(f"Error calling Bedrock model: {str(e)}")
+        for message in dict.fromkeys(errors):
+            st.error(message)
+        return merge_requirement_lists(chunk_requirements)
     
-    def analyze_rfp(self, rfp_text: str) -> List[str]:
-        """Analyze RFP and extract requirements using Bedrock LLM."""
+    def _extract_requirements(self, rfp_text: str, show_progress: bool = False) -> List[str]:
+        """Run the requirements-extraction prompt over one piece of RFP text."""
         prompt = f"""
-        You are an expert procurement analyst. Your task is to analyze the following Request for Proposal (RFP) document and extract high-level, generalized evaluation criteria that can be used to fairly compare multiple vendor proposals.
-
-        **IMPORTANT:** Focus on broad, general requirements rather than specific implementation details. The goal is to create evaluation criteria that multiple vendors can reasonably be expected to address, not to create overly specific technical specifications.
-
         RFP Content:
         {rfp_text}
-
-        Please structure your analysis using the following categories. For each category, identify 2-5 high-level, generalized requirements that capture the essential needs without being overly specific.
-
-        **Categories to Use:**
-
-        * **Functional Requirements:** (What the system must do - focus on capabilities, not specific features)
-        * **Technical Requirements:** (How the system must be built - focus on architecture and integration needs, not specific technologies)
-        * **Security & Compliance:** (Security and regulatory requirements - focus on standards and certifications, not specific implementations)
-        * **Support & Service Level Agreements (SLAs):** (Support and service requirements - focus on availability and response times)
-        * **Project Management & Implementation:** (Implementation process requirements - focus on methodology and timeline)
-        * **Pricing & Contractual Terms:** (Pricing and contract requirements - focus on structure and terms)
-
-        **Guidelines for Requirements:**
-        - Make requirements **general and flexible** enough that multiple vendors can address them
-        - Focus on **what** needs to be accomplished, not **how** it should be done
-        - Avoid overly specific technical details, brand names, or implementation specifics
-        - Use broad, inclusive language that allows for different approaches
-        - Focus on **outcomes and capabilities** rather than specific features
-
-        **Examples of Good vs Bad Requirements:**
-
-        ❌ **Too Specific:** "Must use Oracle Database 19c with Real Application Clusters"
-        ✅ **Generalized:** "Must provide enterprise-grade database capabilities with high availability"
-
-        ❌ **Too Specific:** "Must integrate with SAP ERP version 4.0"
-        ✅ **Generalized:** "Must integrate with existing enterprise resource planning systems"
-
-        ❌ **Too Specific:** "Must provide 99.99% uptime with 15-minute response time"
-        ✅ **Generalized:** "Must provide high availability with defined service level agreements"
-
-        **Output Format:**
-        Provide the list in a clear, nested format with generalized requirements.
-
-        Example:
-        **Functional Requirements**
-        - Must provide comprehensive user management and access control capabilities
-        - Must support automated workflow and approval processes
-        - Must offer reporting and analytics functionality
-
-        **Technical Requirements**
-        - Must integrate with existing enterprise systems and databases
-        - Must provide secure, scalable architecture suitable for enterprise deployment
-        - Must support web-based access with mobile compatibility
-
-        Focus on requirements that are broad enough for fair vendor comparison while still being specific enough to evaluate meaningfully.
         """
         
-        response = self.llm.call_model(prompt)
+        if show_progress:
+            with st.expander("Model output", expanded=True):
+                # write_stream returns [] rather than "" when nothing was streamed
+                response = st.write_stream(self.llm.stream_model(prompt, system=RFP_ANALYSIS_INSTRUCTIONS)) or ""
+        else:
+            response = self.llm.call_model(prompt, system=RFP_ANALYSIS_INSTRUCTIONS)
+        
+        requirements = self._parse_requirements_json(response)
+        if requirements is None:
+            # Model ignored the JSON instruction; fall back to the bullet-list parser
+            requirements = self._parse_requirements_text(response)
+        return requirements
+    
+    @staticmethod
+    def _parse_requirements_json(response: str) -> Optional[List[str]]:
+        """Flatten a {"categories": [...]} response into "**Category**" headers and requirements.
         
+        Returns None when the response holds no usable JSON object.
+        """
+        match = JSON_OBJECT_RE.search(response)
+        if not match:
+            return None
+        try:
+            categories = loads_json(match.group(0))["categories"]
+            requirements = []
+            for category in categories:
+                reqs = [req.strip() for req in category.get("requirements", []) if isinstance(req, str) and req.strip()]
+                if reqs:  # Only add category if it has requirements
+                    requirements.append(f"**{str(category['name']).strip()}**")
+                    requirements.extend(reqs)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+        return requirements or None
+    
+    @staticmethod
+    def _parse_requirements_text(response: str) -> List[str]:
+        """Parse a free-text bullet list response into category headers and requirements."""
         # Parse the response to extract requirements organized by category
         requirements = []
-        lines = response.split('\n')
         current_category = None
         category_requirements = {}
         
-        for line in lines:
-            line = line.strip()
+        # One regex pass classifies every non-empty line as a header, bullet or plain text
+        for match in REQUIREMENT_LINE_RE.finditer(response):
+            header, bullet, text = match.group("header", "bullet", "text")
             
-            # Skip empty lines
-            if not line:
-                continue
-                
             # Check if this is a category header
-            if line.startswith('**') and line.endswith('**'):
-                current_category = line.strip('*').strip()
+            if header is not None:
+                current_category = header.strip('*').strip()
                 category_requirements[current_category] = []
                 continue
             
+            if not current_category:
+                continue
+            
             # Check if this is a requirement (starts with dash or bullet)
-            if line.startswith('-') or line.startswith('•') or line.startswith('*'):
-                # Remove the bullet point and clean up
-                requirement = line[1:].strip()
-                if requirement and len(requirement) > 10:
-                    if current_category:
-                        category_requirements[current_category].append(requirement)
-            elif line and not line.startswith('**') and not line.startswith('Example:') and not line.startswith('Focus on'):
+            if bullet is not None:
+                if len(bullet) > 10:
+                    category_requirements[current_category].append(bullet)
+            elif len(text) > 15 and not text.startswith(('Example:', 'Focus on', 'Please', 'Provide')):
                 # If no bullet point but it looks like a requirement (long enough and not a header)
-                if len(line) > 15 and not line.startswith('Please') and not line.startswith('Provide'):
-                    if current_category:
-                        category_requirements[current_category].append(line)
+                category_requirements[current_category].append(text)
         
         # Convert to flat list with category headers
         for category, reqs in category_requirements.items():
@@ -168,73 +771,57 @@ class VendorEvaluator:
         
         return requirements
     
-    def evaluate_vendor_proposal(self, vendor_text: str, requirements: List[str], vendor_name: str) -> tuple[Dict[str, str], str]:
-        """Evaluate a vendor proposal against the requirements."""
-        # Filter out category headers and summary text for evaluation
-        actual_requirements = []
-        for req in requirements:
-            if (not req.startswith('**') and 
-                not req.endswith('**') and 
-                not req.startswith('---') and 
-                not req.endswith('---') and
-                not 'These requirements represent' in req and
-                not 'core evaluation criteria' in req and
-                len(req.strip()) > 10):
-                actual_requirements.append(req)
+    def _evaluate_requirement_batch(self, vendor_text: str, actual_requirements: List[str], errors: List[str],
+                                    on_progress: Optional[Callable[[int], None]] = None) -> Tuple[Dict[str, str], str, str]:
+        """Score one batch of requirements against a proposal in a single model call.
         
-        requirements_text = "\n".join([f"{i+1}. {req}" for i, req in enumerate(actual_requirements)])
+        on_progress(assessed_count), if given, is called each time another
+        requirement's verdict streams in. If the output is cut off at max_tokens,
+        the verdicts that arrived whole are kept and the rest are scored again in
+        smaller batches. A failed Bedrock call is appended to errors, for the caller
+        to display, and its requirements are marked as not assessed.
+        Returns (evaluations, price_info, raw response).
+        """
+        # Whitespace is collapsed in the prompt only; verdicts map back by number
+        requirements_text = "\n".join([f"{i+1}. {' '.join(req.split())}" for i, req in enumerate(actual_requirements)])
         
-        prompt = f"""
-        You are an expert procurement analyst. Your task is to conduct a detailed evaluation of a vendor's proposal against a provided list of RFP requirements. You must be strict, objective, and avoid making assumptions. If information is not present, you must say so.
-
+        # The rubric (system) and requirements list are identical for every vendor
+        # evaluated against this matrix, so both form the cached prefix
+        requirements_block = f"""
         Requirements to evaluate against:
         {requirements_text}
-
+        """
+        prompt = f"""
         Vendor Proposal Content:
         {vendor_text}
-
-        For each requirement, provide a detailed evaluation with the following format:
-
-        **Evaluation Format:**
-        For each requirement, respond with:
-        1. **Assessment**: "Yes", "No", or "Not Sure"
-        2. **Explanation**: 2-3 sentences explaining your assessment
-
-        **Assessment Criteria:**
-        - **Yes**: The proposal clearly and specifically addresses the requirement with sufficient detail
-        - **No**: The requirement is not mentioned, is vague, or lacks sufficient detail
-        - **Not Sure**: The proposal mentions something related but it's unclear if it fully meets the requirement
-
-        **Important Guidelines:**
-        - Be strict and objective - do not make assumptions
-        - If information is not present, say "Not Sure" and explain why
-        - Do not create or infer information that is not explicitly stated
-        - Provide specific evidence from the proposal to support your assessment
-        - Keep explanations concise but informative (2-3 sentences max)
-
-        **Response Format:**
-        Provide your evaluation in this exact format:
-
-        Requirement 1: [Yes/No/Not Sure] - [2-3 sentence explanation]
-        Requirement 2: [Yes/No/Not Sure] - [2-3 sentence explanation]
-        ...and so on for each requirement
-
-        **Price Information:**
-        After your evaluations, extract and provide pricing information from the proposal:
-        - Look for total project cost, implementation cost, annual fees, or any pricing details
-        - If multiple pricing options are provided, include all relevant pricing information
-        - If no pricing information is found, state "No pricing information found in proposal"
-        - Format: "Total Project Cost: [amount]" or "Implementation Cost: [amount], Annual Fee: [amount]" etc.
-
-        **Scoring Information:**
-        After your evaluations, provide a summary:
-        - Total Yes responses: [count]
-        - Total No responses: [count] 
-        - Total Not Sure responses: [count]
-        - Score: [Yes count × 1 + Not Sure count × 0.5] out of [total requirements]
         """
         
-        response = self.llm.call_model(prompt)
+        # Output is one JSON item per requirement plus the price; batches are sized so
+        # this stays under EVAL_MAX_TOKENS. temperature 0 keeps verdicts repeatable
+        max_tokens = min(EVAL_MAX_TOKENS, EVAL_TOKENS_PER_REQUIREMENT * len(actual_requirements) + 500)
+        model_args = dict(max_tokens=max_tokens, cached_prefix=requirements_block,
+                          system=VENDOR_EVALUATION_RUBRIC, temperature=0, tool=EVALUATION_TOOL)
+        # Streamed so the stop reason is known and a cut-off tool input is still
+        # available as text. Each evaluation item carries one "assessment" key, so
+        # counting them in the partial tool input tracks how many verdicts have arrived
+        stream = self.llm.stream_model(prompt, **model_args)
+        response = ""
+        assessed = 0
+        try:
+            while True:
+                response += next(stream)
+                count = response.count('"assessment"')
+                if on_progress is not None and count != assessed:
+                    assessed = count
+                    on_progress(assessed)
+        except StopIteration as stop:
+            stop_reason = stop.value
+        except Exception as e:
+            errors.append(f"Error calling Bedrock model: {str(e)}")
+            evaluations = (self._parse_evaluation_json(response, actual_requirements) or ({}, ""))[0]
+            for req in actual_requirements:
+                evaluations.setdefault(req, "Not Sure - The Bedrock call failed before this requirement was assessed")
+            return evaluations, "No pricing information found in proposal", response
         
         # Parse the response to extract evaluations and scoring
         evaluations = {}
@@ -244,7 +831,17 @@ class VendorEvaluator:
         total_requirements = len(actual_requirements)
         price_info = "No pricing information found in proposal"
         
-        lines = response.strip().split('\n')
+        structured = self._parse_evaluation_json(response, actual_requirements)
+        if structured is not None:
+            evaluations, price_info = structured
+        
+        if stop_reason == "max_tokens":
+            return self._rescore_truncated_batch(vendor_text, actual_requirements, evaluations, response, errors, on_progress)
+        
+        # Free-text fallback, for responses that did not come back through the tool;
+        # tool input JSON is never read as text
+        tool_output = response.lstrip().startswith("{")
+        lines = response.strip().split('\n') if structured is None and not tool_output else []
         current_requirement_index = 0
         
         for line in lines:
@@ -317,55 +914,142 @@ class VendorEvaluator:
                     pass
         
         # If we didn't get any evaluations, try a simpler parsing approach
-        if not evaluations and actual_requirements:
+        if not evaluations and actual_requirements and not tool_output:
             # Try to find Yes/No/Not Sure patterns in the response
             response_lower = response.lower()
-            for i, req in enumerate(actual_requirements):
-                # Look for patterns around this requirement
-                req_lower = req.lower()
-                if req_lower in response_lower:
-                    # Find the section around this requirement
-                    req_index = response_lower.find(req_lower)
-                    if req_index != -1:
-                        # Look for assessment keywords in the surrounding text
-                        surrounding_text = response[max(0, req_index-200):req_index+200].lower()
-                        
-                        if 'yes' in surrounding_text and 'no' not in surrounding_text:
-                            yes_count += 1
-                            evaluations[req] = "Yes - Requirement clearly addressed in proposal"
-                        elif 'no' in surrounding_text:
-                            no_count += 1
-                            evaluations[req] = "No - Requirement not found or insufficiently addressed"
-                        else:
-                            not_sure_count += 1
-                            evaluations[req] = "Not Sure - Unable to determine from proposal content"
+            for req in actual_requirements:
+                # Find the section around this requirement (one scan, no separate `in` check)
+                req_index = response_lower.find(req.lower())
+                if req_index != -1:
+                    # Look for assessment keywords in the surrounding text
+                    surrounding_text = response_lower[max(0, req_index-200):req_index+200]
+                    
+                    if 'yes' in surrounding_text and 'no' not in surrounding_text:
+                        yes_count += 1
+                        evaluations[req] = "Yes - Requirement clearly addressed in proposal"
+                    elif 'no' in surrounding_text:
+                        no_count += 1
+                        evaluations[req] = "No - Requirement not found or insufficiently addressed"
+                    else:
+                        not_sure_count += 1
+                        evaluations[req] = "Not Sure - Unable to determine from proposal content"
                 else:
                     not_sure_count += 1
                     evaluations[req] = "Not Sure - Requirement not found in proposal"
         
+        return evaluations, price_info, response
+    
+    def _rescore_truncated_batch(self, vendor_text: str, actual_requirements: List[str], evaluations: Dict[str, str], response: str,
+                                 errors: List[str], on_progress: Optional[Callable[[int], None]]) -> Tuple[Dict[str, str], str, str]:
+        """Finish a batch whose output was cut off at max_tokens.
+        
+        The requirements left without a verdict are scored again: together when some
+        verdicts arrived, otherwise split in half. A single requirement that still
+        does not fit is reported as not assessed. The price, which the cut-off
+        output lacks, comes from the retries.
+        """
+        evaluations = dict(evaluations)
+        price_info = "No pricing information found in proposal"
+        missing = [req for req in actual_requirements if req not in evaluations]
+        if len(missing) < len(actual_requirements):
+            retry_batches = [missing] if missing else []
+        elif len(missing) > 1:
+            retry_batches = [missing[:len(missing) // 2], missing[len(missing) // 2:]]
+        else:
+            retry_batches = []
+        
+        for batch in retry_batches:
+            done = len(evaluations)
+            batch_progress = (lambda assessed, done=done: on_progress(done + assessed)) if on_progress else None
+            batch_evaluations, batch_price_info, batch_response = self._evaluate_requirement_batch(vendor_text, batch, errors, batch_progress)
+            evaluations.update(batch_evaluations)
+            if price_info.startswith("No pricing information"):
+                price_info = batch_price_info
+            response = f"{response}\n\n{batch_response}"
+        
+        for req in actual_requirements:
+            evaluations.setdefault(req, "Not Sure - The evaluation was cut off at the output limit before this requirement was assessed")
+        return evaluations, price_info, response
+    
+    def evaluate_vendor_proposal(self, vendor_text: str, requirements: List[str], vendor_name: str,
+                                 on_progress: Optional[Callable[[int, int], None]] = None,
+                                 errors: Optional[List[str]] = None) -> tuple[Dict[str, str], str]:
+        """Evaluate a vendor proposal against the requirements.
+        
+        on_progress(assessed, total), if given, is called as verdicts stream in. It
+        runs on the threads scoring the batches, so it must not update Streamlit elements.
+        Bedrock errors are appended to errors when it is given (as it must be when this
+        runs on a worker thread); otherwise they are shown with st.error.
+        """
+        # Classify each row once: category headers and summary text are labels shown
+        # as "N/A"; the remaining rows that look like requirements are evaluated
+        actual_requirements = []
+        label_rows = set()
+        for req in requirements:
+            if ((req.startswith('**') and req.endswith('**')) or
+                (req.startswith('---') and req.endswith('---')) or
+                'These requirements represent' in req or
+                'core evaluation criteria' in req):
+                label_rows.add(req)
+            elif not req.startswith(('**', '---')) and not req.endswith(('**', '---')) and len(req.strip()) > 10:
+                actual_requirements.append(req)
+        # Repeated rows share one verdict, so each is sent to the model only once
+        actual_requirements = list(dict.fromkeys(actual_requirements))
+        
+        # Large matrices are scored in batches of EVAL_BATCH_SIZE requirements so each
+        # response stays within the output budget; batches run concurrently
+        batches = [actual_requirements[i:i + EVAL_BATCH_SIZE]
+                   for i in range(0, len(actual_requirements), EVAL_BATCH_SIZE)] or [[]]
+        
+        # Verdicts received so far per batch; each batch thread only writes its own slot
+        assessed_by_batch = [0] * len(batches)
+        
+        def evaluate_batch(index: int) -> Tuple[Dict[str, str], str, str]:
+            batch_progress = None
+            if on_progress is not None:
+                def batch_progress(assessed: int) -> None:
+                    assessed_by_batch[index] = min(assessed, len(batches[index]))
+                    on_progress(sum(assessed_by_batch), len(actual_requirements))
+            return self._evaluate_requirement_batch(vendor_text, batches[index], batch_errors, batch_progress)
+        
+        batch_errors: List[str] = []
+        if len(batches) == 1:
+            batch_results = [evaluate_batch(0)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_EVALUATIONS, len(batches))) as executor:
+                batch_results = list(executor.map(evaluate_batch, range(len(batches))))
+        if errors is not None:
+            errors.extend(batch_errors)
+        else:
+            for message in dict.fromkeys(batch_errors):
+                st.error(message)
+        
+        evaluations = {}
+        price_info = "No pricing information found in proposal"
+        for batch_evaluations, batch_price_info, _ in batch_results:
+            evaluations.update(batch_evaluations)
+            if price_info.startswith("No pricing information") and not batch_price_info.startswith("No pricing information"):
+                price_info = batch_price_info
+        response = "\n\n".join(batch_response for _, _, batch_response in batch_results)
+        
         # Create final result including category headers
         result = {}
         for req in requirements:
-            if req.startswith('**') and req.endswith('**'):
-                # Category header - no evaluation needed
+            if req in label_rows:
+                # Category header or summary text - no evaluation needed
                 result[req] = "N/A"
-            elif req.startswith('---') and req.endswith('---'):
-                # Category header - no evaluation needed
-                result[req] = "N/A"
-            elif 'These requirements represent' in req or 'core evaluation criteria' in req:
-                # Summary text - no evaluation needed
-                result[req] = "N/A"
-            elif req in evaluations:
-                result[req] = evaluations[req]
             else:
                 # If no evaluation was provided by the LLM, it means no information was found
                 # This should be marked as "No" rather than "Not Sure"
-                result[req] = "No - No information found in proposal"
+                result[req] = evaluations.get(req, "No - No information found in proposal")
         
-        # Calculate scores by counting from the final result (more reliable than parsing LLM response)
-        yes_count = sum(1 for val in result.values() if val.startswith('Yes -'))
-        no_count = sum(1 for val in result.values() if val.startswith('No -'))
-        not_sure_count = sum(1 for val in result.values() if val.startswith('Not Sure -'))
+        # Count verdicts from the final result (more reliable than parsing LLM response);
+        # repeated matrix rows share one result entry and are counted once
+        verdict_counts = Counter(value.partition(' -')[0] for value in result.values() if ' -' in value)
+        
+        yes_count = verdict_counts['Yes']
+        no_count = verdict_counts['No']
+        not_sure_count = verdict_counts['Not Sure']
         
         # Calculate score
         score = yes_count * 1 + not_sure_count * 0.5
@@ -383,6 +1067,104 @@ class VendorEvaluator:
         
         return result, response
     
+    @staticmethod
+    def _parse_evaluation_json(response: str, actual_requirements: List[str]) -> Optional[Tuple[Dict[str, str], str]]:
+        """Map a submit_evaluation tool input onto the requirements.
+        
+        Returns (evaluations, price_info), or None when the response is not usable JSON.
+        """
+        verdicts = {"YES": "Yes", "NO": "No", "NOT SURE": "Not Sure"}
+        try:
+            data = loads_json(response)
+        except ValueError:
+            # Tool input cut off part-way: use the evaluation items that arrived whole
+            data = {"evaluations": complete_json_array_items(response, "evaluations")}
+        try:
+            evaluations = {}
+            for item in data["evaluations"]:
+                index = int(item["requirement_number"]) - 1
+                verdict = verdicts.get(str(item["assessment"]).strip().upper())
+                if verdict and 0 <= index < len(actual_requirements):
+                    evaluations[actual_requirements[index]] = f"{verdict} - {str(item.get('explanation', '')).strip()}"
+            price_info = str(data.get("price_information") or "").strip() or "No pricing information found in proposal"
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+        return (evaluations, price_info) if evaluations else None
+    
+    def evaluate_vendor_proposals(self, proposals: List[Tuple[str, str]], requirements: List[str],
+                                  on_complete: Optional[Callable[[str, int], None]] = None,
+                                  on_progress: Optional[Callable[[str, int, int], None]] = None) -> Dict[str, tuple[Dict[str, str], str]]:
+        """Evaluate several (vendor_name, proposal_text) pairs concurrently.
+        
+        Each evaluation is a network-bound Bedrock call and the boto3 client is
+        thread-safe, so a small thread pool brings the wall-clock time close to the
+        slowest single evaluation. Results are keyed by vendor name in input order.
+        Both callbacks are called from the calling thread, so they may update
+        Streamlit elements: on_complete(vendor_name, finished_count) as each
+        evaluation finishes, e.g. to drive a progress bar, and
+        on_progress(vendor_name, assessed, total) when a vendor's count of
+        streamed verdicts has changed, checked a few times a second. Bedrock errors
+        are shown with st.error, from this thread, as each vendor finishes.
+        """
+        if not proposals:
+            return {}
+        
+        # Workers never touch Streamlit: Streamlit's message queue is not safe to write
+        # from several threads, so they only record verdict counts and errors, and
+        # the status lines, progress bar and error messages are all written here
+        progress_lock = threading.Lock()
+        progress_by_vendor: Dict[str, Tuple[int, int]] = {}
+        reported: Dict[str, Tuple[int, int]] = {}
+        
+        def record_progress(vendor_name: str, assessed: int, total: int) -> None:
+            with progress_lock:
+                progress_by_vendor[vendor_name] = (assessed, total)
+        
+        errors_by_vendor: Dict[str, List[str]] = {vendor_name: [] for vendor_name, _ in proposals}
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_EVALUATIONS, len(proposals))) as executor:
+            futures = {
+                executor.submit(
+                    self.evaluate_vendor_proposal, proposal_text, requirements, vendor_name,
+                    (lambda assessed, total, name=vendor_name: record_progress(name, assessed, total)) if on_progress else None,
+                    errors_by_vendor[vendor_name],
+                ): vendor_name
+                for vendor_name, proposal_text in proposals
+            }
+            pending = set(futures)
+            finished_count = 0
+            while pending:
+                done, pending = wait(pending, timeout=0.25, return_when=FIRST_COMPLETED)
+                if on_progress is not None:
+                    with progress_lock:
+                        changed = {name: counts for name, counts in progress_by_vendor.items() if reported.get(name) != counts}
+                    for vendor_name, (assessed, total) in changed.items():
+                        reported[vendor_name] = (assessed, total)
+                        on_progress(vendor_name, assessed, total)
+                for future in done:
+                    finished_count += 1
+                    for message in dict.fromkeys(errors_by_vendor[futures[future]]):
+                        st.error(f"{futures[future]}: {message}")
+                    if on_complete is not None:
+                        on_complete(futures[future], finished_count)
+            results = {vendor_name: future.result() for future, vendor_name in futures.items()}
+        return {vendor_name: results[vendor_name] for vendor_name, _ in proposals}
+    
+    def _read_matrix(self) -> pd.DataFrame:
+        """Return the evaluation matrix, re-parsing the CSV only when the file has changed."""
+        mtime = os.stat(self.evaluation_matrix_file).st_mtime_ns
+        if self._matrix is None or mtime != self._matrix_mtime:
+            # The evaluator is rebuilt on every rerun, so share parses across reruns too
+            self._matrix = load_evaluation_matrix(self.evaluation_matrix_file, mtime)
+            self._matrix_mtime = mtime
+        return self._matrix.copy()
+    
+    def _write_matrix(self, df: pd.DataFrame):
+        """Persist the matrix as CSV and keep the written frame as the in-memory copy."""
+        df.to_csv(self.evaluation_matrix_file, index=False)
+        self._matrix = df
+        self._matrix_mtime = os.stat(self.evaluation_matrix_file).st_mtime_ns
+    
     def create_evaluation_matrix(self, requirements: List[str]):
         """Create the initial evaluation matrix CSV file."""
         # Process requirements to handle category headers
@@ -396,67 +1178,71 @@ class VendorEvaluator:
                 processed_requirements.append(req)
         
         df = pd.DataFrame({"Requirements": processed_requirements})
-        df.to_csv(self.evaluation_matrix_file, index=False)
+        self._write_matrix(df)
         st.success(f"Evaluation matrix created with {len(processed_requirements)} items (including category headers)!")
     
-    def update_evaluation_matrix(self, vendor_evaluations: Dict[str, str], vendor_name: str):
-        """Update the evaluation matrix with vendor scores."""
+    def update_evaluation_matrix(self, vendor_evaluations: Dict[str, str], vendor_name: str) -> pd.DataFrame:
+        """Update the evaluation matrix with vendor scores and return the updated matrix."""
+        return self.update_evaluation_matrix_multi({vendor_name: vendor_evaluations})
+    
+    def update_evaluation_matrix_multi(self, evaluations_by_vendor: Dict[str, Dict[str, str]]) -> pd.DataFrame:
+        """Add several vendors' scores to the evaluation matrix with one read and one write.
+        
+        Returns the updated matrix, so callers need not read it back from disk.
+        """
         try:
-            df = pd.read_csv(self.evaluation_matrix_file)
+            df = self._read_matrix()
             
-            # Add new vendor column
-            df[vendor_name] = df['Requirements'].map(vendor_evaluations)
-            
-            # Handle any new rows that might have been added (like price info and scoring)
-            for req, evaluation in vendor_evaluations.items():
-                if req not in df['Requirements'].values:
-                    # Add new row for this requirement
-                    new_row = pd.DataFrame({'Requirements': [req], vendor_name: [evaluation]})
-                    df = pd.concat([df, new_row], ignore_index=True)
-            
-            # Ensure price and scoring information are at the bottom
-            # Move price and scoring rows to the end if they exist
-            price_rows = df[df['Requirements'].str.contains('PRICE INFORMATION', na=False)]
-            scoring_rows = df[df['Requirements'].str.contains('SCORING SUMMARY', na=False)]
-            
-            # Remove price and scoring rows from their current positions
-            df = df[~df['Requirements'].str.contains('PRICE INFORMATION|SCORING SUMMARY', na=False)]
+            for vendor_name, vendor_evaluations in evaluations_by_vendor.items():
+                # Add new vendor column via an index lookup rather than a per-row dict map
+                scores = pd.Series(vendor_evaluations, dtype=object)
+                df[vendor_name] = scores.reindex(df['Requirements']).to_numpy()
+                
+                # Handle any new rows that might have been added (like price info and scoring)
+                new_rows = scores[~scores.index.isin(df['Requirements'])]
+                if not new_rows.empty:
+                    df = pd.concat(
+                        [df, pd.DataFrame({'Requirements': new_rows.index, vendor_name: new_rows.to_numpy()})],
+                        ignore_index=True
+                    )
             
-            # Add them back at the end
-            if not price_rows.empty:
-                df = pd.concat([df, price_rows], ignore_index=True)
-            if not scoring_rows.empty:
-                df = pd.concat([df, scoring_rows], ignore_index=True)
+            # Ensure price and scoring information are at the bottom: rank requirement
+            # rows 0, price 1, scoring 2 in one regex pass and stable-sort by rank
+            tail_row = df['Requirements'].str.extract('(PRICE INFORMATION|SCORING SUMMARY)', expand=False)
+            rank = tail_row.map({'PRICE INFORMATION': 1, 'SCORING SUMMARY': 2}).fillna(0)
+            df = df.iloc[rank.argsort(kind='stable')].reset_index(drop=True)
             
             # Save updated matrix
-            df.to_csv(self.evaluation_matrix_file, index=False)
-            st.success(f"Evaluation matrix updated with {vendor_name} scores!")
+            self._write_matrix(df)
+            st.success(f"Evaluation matrix updated with {', '.join(evaluations_by_vendor)} scores!")
+            return df.copy()
             
         except Exception as e:
             st.error(f"Error updating evaluation matrix: {str(e)}")
+            return self.get_evaluation_matrix()
     
     def get_evaluation_matrix(self) -> pd.DataFrame:
         """Get the current evaluation matrix."""
         try:
-            return pd.read_csv(self.evaluation_matrix_file)
+            return self._read_matrix()
         except FileNotFoundError:
             return pd.DataFrame()
     
     def calculate_scores_from_csv(self, vendor_name: str) -> Dict[str, any]:
         """Calculate scores directly from the CSV file for a specific vendor."""
         try:
-            df = pd.read_csv(self.evaluation_matrix_file)
+            df = self._read_matrix()
             
             if vendor_name not in df.columns:
                 return {"error": f"Vendor {vendor_name} not found in matrix"}
             
-            # Filter out category headers and summary rows
-            evaluations = df[df[vendor_name] != "N/A"][vendor_name].tolist()
-            
-            # Count assessments
-            yes_count = sum(1 for val in evaluations if val.startswith('Yes -'))
-            no_count = sum(1 for val in evaluations if val.startswith('No -'))
-            not_sure_count = sum(1 for val in evaluations if val.startswith('Not Sure -'))
+            # Count assessments in one vectorized pass; category headers, summary rows
+            # and empty cells have no verdict prefix and are left out
+            verdicts = df[vendor_name].astype("string").str.extract(r'^(Yes|No|Not Sure) -', expand=False)
+            counts = verdicts.value_counts()
+            yes_count = int(counts.get('Yes', 0))
+            no_count = int(counts.get('No', 0))
+            not_sure_count = int(counts.get('Not Sure', 0))
             
             # Calculate score
             score = yes_count * 1 + not_sure_count * 0.5
@@ -475,24 +1261,72 @@ class VendorEvaluator:
         except Exception as e:
             return {"error": f"Error calculating scores: {str(e)}"}
 
-def check_aws_credentials():
-    """Check if AWS credentials are properly configured."""
+def markdown_paragraph(text: str) -> str:
+    """Collapse whitespace so text stays inside one markdown paragraph.
+    
+    Without newlines the text cannot open a code fence, heading or list that would
+    restyle the rows rendered after it in the same st.markdown call.
+    """
+    return " ".join(str(text).split())
+
+def classify_evaluation_rows(vendor_evaluations: Dict[str, str]) -> List[Tuple[str, str, str]]:
+    """Label each (requirement, evaluation) pair for display in one pass.
+    
+    Kinds are "summary" (price and scoring rows, shown by value), "header"
+    (category rows) and "requirement".
+    """
+    rows = []
+    for req, evaluation in vendor_evaluations.items():
+        if SECTION_ROW_RE.match(req):
+            kind = "summary" if SUMMARY_ROW_RE.search(req) else "header"
+        elif evaluation == "N/A":
+            kind = "header"
+        else:
+            kind = "requirement"
+        rows.append((kind, req, evaluation))
+    return rows
+
+# Every session's script thread shares the store, so lookups and updates hold this lock
+_rfp_store_lock = threading.Lock()
+
+@st.cache_resource(show_spinner=False)
+def get_rfp_requirements_store() -> Dict[Tuple[str, str], List[str]]:
+    """Parsed requirement lists by (RFP text hash, model), shared across reruns and sessions."""
+    return {}
+
+def analyze_rfp_cached(evaluator: VendorEvaluator, rfp_text: str, model_id: str) -> List[str]:
+    """Run VendorEvaluator.analyze_rfp once per (RFP text, model) across reruns.
+    
+    Only the parsed list is kept. The model output is streamed into the page on
+    the first run; st.cache_data would record every streamed update and replay
+    them all on each later rerun. An empty result raises instead of being stored
+    so a failed Bedrock call is retried on the next rerun.
+    """
+    store = get_rfp_requirements_store()
+    key = (hashlib.sha256(rfp_text.encode("utf-8")).hexdigest(), model_id)
+    with _rfp_store_lock:
+        requirements = store.get(key)
+    if requirements is None:
+        # The analysis runs outside the lock so other sessions are not held up by it
+        requirements = evaluator.analyze_rfp(rfp_text, show_progress=True)
+        if not requirements:
+            raise ValueError("No requirements could be extracted from the RFP.")
+        with _rfp_store_lock:
+            if len(store) >= RFP_ANALYSIS_ENTRIES:
+                store.pop(next(iter(store)), None)  # drop the oldest analysis
+            store[key] = requirements
+    return list(requirements)
+
+@st.cache_data(show_spinner=False, ttl=CREDENTIALS_CHECK_TTL)
+def verify_aws_access(access_key: str, secret_key: str, session_token: Optional[str]) -> Tuple[bool, str]:
+    """Call STS and Bedrock with the given credentials, memoized for CREDENTIALS_CHECK_TTL seconds.
+    
+    The credentials are part of the cache key, so a different set of credentials is
+    checked rather than served from the cache. Values already in the environment
+    take precedence over .env (load_dotenv does not override them), so edits to
+    .env take effect after a restart.
+    """
     try:
-        # Check if .env file exists
-        if not os.path.exists('.env'):
-            return False, ".env file not found. Please create a .env file with your AWS credentials."
-        
-        # Load environment variables from .env file
-        load_dotenv()
-        
-        # Check if required credentials are present
-        access_key = os.getenv("AWS_ACCESS_KEY_ID")
-        secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
-        session_token = os.getenv("AWS_SESSION_TOKEN")
-        
-        if not access_key or not secret_key:
-            return False, "AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY are required in .env file"
-        
         # Create session with credentials from environment variables
         session_kwargs = {
             'aws_access_key_id': access_key,
@@ -511,13 +1345,38 @@ def check_aws_credentials():
         
         # Test Bedrock access
         bedrock = session.client('bedrock', region_name=AWS_REGION)
-        models = bedrock.list_foundation_models()
+        # Filtered to the provider in use: a much smaller response than the full catalog
+        models = bedrock.list_foundation_models(byProvider="Anthropic")
         
         return True, f"AWS credentials valid - User: {identity.get('Arn', 'Unknown')}"
         
     except Exception as e:
         return False, f"Error checking AWS credentials: {str(e)}"
 
+def check_aws_credentials():
+    """Check if AWS credentials are properly configured."""
+    try:
+        # Check if .env file exists
+        if not os.path.exists('.env'):
+            return False, ".env file not found. Please create a .env file with your AWS credentials."
+        
+        # Load environment variables from .env file
+        load_dotenv()
+        
+        # Check if required credentials are present
+        access_key = os.getenv("AWS_ACCESS_KEY_ID")
+        secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
+        session_token = os.getenv("AWS_SESSION_TOKEN")
+        
+        if not access_key or not secret_key:
+            return False, "AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY are required in .env file"
+        
+        # STS and list_foundation_models are network calls; don't repeat them on every rerun
+        return verify_aws_access(access_key, secret_key, session_token)
+        
+    except Exception as e:
+        return False, f"Error checking AWS credentials: {str(e)}"
+
 def main():
     st.set_page_config(
         page_title="Vendor Evaluation Tool",
@@ -600,7 +1459,10 @@ def main():
                     
                     # Analyze RFP and extract requirements
                     st.info("Analyzing RFP and extracting requirements using Amazon Bedrock...")
-                    requirements = evaluator.analyze_rfp(rfp_text)
+                    try:
+                        requirements = analyze_rfp_cached(evaluator, rfp_text, evaluator.llm.model_id)
+                    except ValueError:
+                        requirements = []
                     
                     if requirements:
                         st.success(f"Successfully extracted {len(requirements)} requirements!")
@@ -644,9 +1506,9 @@ def main():
         
         st.markdown("""
         **Instructions:**
-        1. Upload vendor proposal PDF files (one at a time)
+        1. Upload one or more vendor proposal PDF files
         2. Provide the vendor name for each proposal
-        3. The system will evaluate the proposal against the existing requirements
+        3. The system will evaluate the proposals against the existing requirements in parallel
         4. The evaluation matrix will be updated with vendor scores
         """)
         
@@ -662,86 +1524,119 @@ def main():
             st.dataframe(current_matrix)
         
         # Vendor proposal upload
-        uploaded_proposal = st.file_uploader(
-            "Upload Vendor Proposal (PDF)",
+        uploaded_proposals = st.file_uploader(
+            "Upload Vendor Proposals (PDF)",
             type=['pdf'],
-            help="Upload a vendor proposal PDF file"
+            accept_multiple_files=True,
+            help="Upload one or more vendor proposal PDF files"
         )
         
-        vendor_name = st.text_input(
-            "Vendor Name",
-            help="Enter the name of the vendor (this will be used as the column header in the matrix)"
-        )
+        # One vendor name per proposal, defaulting to the file name
+        vendor_names = [
+            st.text_input(
+                f"Vendor Name for {uploaded_proposal.name}",
+                value=os.path.splitext(uploaded_proposal.name)[0],
+                key=f"vendor_name_{uploaded_proposal.file_id}",
+                help="Enter the name of the vendor (this will be used as the column header in the matrix)"
+            )
+            for uploaded_proposal in uploaded_proposals
+        ]
         
-        if uploaded_proposal is not None and vendor_name:
-            # Check if vendor already exists in matrix
-            if not current_matrix.empty and vendor_name in current_matrix.columns:
-                st.warning(f"Vendor '{vendor_name}' already exists in the evaluation matrix. The scores will be updated.")
+        if uploaded_proposals and all(vendor_names):
+            if len(set(vendor_names)) != len(vendor_names):
+                st.error("Each proposal needs a unique vendor name.")
+                return
+            
+            # Check if vendors already exist in matrix
+            for vendor_name in vendor_names:
+                if not current_matrix.empty and vendor_name in current_matrix.columns:
+                    st.warning(f"Vendor '{vendor_name}' already exists in the evaluation matrix. The scores will be updated.")
             
-            if st.button("Evaluate Vendor Proposal"):
-                with st.spinner("Processing vendor proposal..."):
-                    # Extract text from PDF
-                    proposal_text = evaluator.pdf_processor.extract_text_from_pdf(uploaded_proposal)
+            if st.button("Evaluate Vendor Proposals"):
+                with st.spinner("Processing vendor proposals..."):
+                    # Extract text from PDFs
+                    proposals = []
+                    for uploaded_proposal, vendor_name in zip(uploaded_proposals, vendor_names):
+                        proposal_text = evaluator.pdf_processor.extract_text_from_pdf(uploaded_proposal, PROPOSAL_MAX_CHARS)
+                        if proposal_text:
+                            if len(proposal_text) >= PROPOSAL_MAX_CHARS:
+                                st.warning(f"{uploaded_proposal.name} is very long; only its first {PROPOSAL_MAX_CHARS:,} characters will be evaluated.")
+                            proposals.append((vendor_name, proposal_text))
+                        else:
+                            st.error(f"Could not extract text from {uploaded_proposal.name}.")
                     
-                    if proposal_text:
-                        st.success("Proposal text extracted successfully!")
+                    if proposals:
+                        st.success(f"Text extracted from {len(proposals)} proposal(s)!")
                         
                         # Get requirements from current matrix
                         requirements = current_matrix['Requirements'].tolist()
                         
-                        # Evaluate proposal
-                        st.info("Evaluating proposal against requirements using Amazon Bedrock...")
-                        vendor_evaluations, response = evaluator.evaluate_vendor_proposal(
-                            proposal_text, requirements, vendor_name
+                        # Evaluate all proposals concurrently
+                        st.info("Evaluating proposals against requirements using Amazon Bedrock...")
+                        progress = st.progress(0.0, text=f"Evaluated 0 of {len(proposals)} proposal(s)")
+                        # One live line per vendor, updated as its verdicts stream in
+                        vendor_status = {vendor_name: st.empty() for vendor_name, _ in proposals}
+                        results = evaluator.evaluate_vendor_proposals(
+                            proposals, requirements,
+                            on_complete=lambda vendor_name, done: progress.progress(
+                                done / len(proposals), text=f"Evaluated {done} of {len(proposals)} proposal(s) (last: {vendor_name})"
+                            ),
+                            on_progress=lambda vendor_name, assessed, total: vendor_status[vendor_name].caption(
+                                f"{vendor_name}: {assessed} of {total} requirements assessed"
+                            ),
                         )
+                        progress.empty()
+                        for status in vendor_status.values():
+                            status.empty()
                         
-                        # Add price information to evaluations
-                        if "--- PRICE INFORMATION ---" in vendor_evaluations:
-                            price_info = vendor_evaluations["--- PRICE INFORMATION ---"]
-                            st.success(f"📊 **Price Information:** {price_info}")
-                        
-                        # Debug: Show the raw LLM response
-                        with st.expander("Debug: Raw LLM Response"):
-                            st.text(response)
-                        
-                        # Display evaluation results
-                        st.subheader(f"Evaluation Results for {vendor_name}:")
-                        
-                        # Create a more compact display
-                        for req, evaluation in vendor_evaluations.items():
-                            if req.startswith('---') and req.endswith('---'):
-                                # This is a header or scoring summary
-                                if 'SCORING SUMMARY' in req:
-                                    st.markdown(f"**{evaluation}**")
-                                elif 'PRICE INFORMATION' in req:
-                                    st.markdown(f"**{evaluation}**")
-                                else:
+                        for vendor_name, (vendor_evaluations, response) in results.items():
+                            # Add price information to evaluations
+                            if "--- PRICE INFORMATION ---" in vendor_evaluations:
+                                price_info = vendor_evaluations["--- PRICE INFORMATION ---"]
+                                st.success(f"📊 **Price Information ({vendor_name}):** {price_info}")
+                            
+                            # Debug: Show the raw LLM response
+                            with st.expander(f"Debug: Raw LLM Response ({vendor_name})"):
+                                st.text(response)
+                            
+                            # Display evaluation results
+                            st.subheader(f"Evaluation Results for {vendor_name}:")
+                            
+                            # Build the whole block as one markdown string so it is sent to the
+                            # browser as a single element rather than several per requirement.
+                            # Each value is kept to one paragraph so unbalanced markup in one
+                            # row cannot carry over into the rows after it
+                            blocks = []
+                            for kind, req, evaluation in classify_evaluation_rows(vendor_evaluations):
+                                req, evaluation = markdown_paragraph(req), markdown_paragraph(evaluation)
+                                if kind == "summary":
+                                    # Price information or scoring summary
+                                    blocks.append(f"**{evaluation}**")
+                                elif kind == "header":
                                     # Category header - make it stand out but not too much spacing
-                                    st.markdown(f"**{req}**")
-                            elif evaluation == "N/A":
-                                # Category header - just show the category name
-                                st.markdown(f"**{req}**")
-                            else:
-                                # Regular requirement with evaluation - compact format
-                                st.markdown(f"**{req}**")
-                                st.markdown(f"*{evaluation}*")
-                                st.markdown("")  # Just one line break instead of separator
-                        
-                        # Show scoring summary in a nice format
-                        if "--- SCORING SUMMARY ---" in vendor_evaluations:
-                            score_info = vendor_evaluations["--- SCORING SUMMARY ---"]
-                            st.success(f"📊 **Final Score:** {score_info}")
-                        
-                        # Update evaluation matrix
-                        evaluator.update_evaluation_matrix(vendor_evaluations, vendor_name)
+                                    blocks.append(f"**{req}**")
+                                else:
+                                    # Regular requirement with evaluation - compact format
+                                    blocks.append(f"**{req}**\n\n*{evaluation}*")
+                            st.markdown("\n\n".join(blocks))
+                            
+                            # Show scoring summary in a nice format
+                            if "--- SCORING SUMMARY ---" in vendor_evaluations:
+                                score_info = vendor_evaluations["--- SCORING SUMMARY ---"]
+                                st.success(f"📊 **Final Score:** {score_info}")
+                            
+                        # Update evaluation matrix for all vendors with a single CSV write
+                        updated_matrix = evaluator.update_evaluation_matrix_multi(
+                            {vendor_name: vendor_evaluations for vendor_name, (vendor_evaluations, _) in results.items()}
+                        )
                         
-                        # Verify scores by calculating from CSV
-                        csv_scores = evaluator.calculate_scores_from_csv(vendor_name)
-                        if "error" not in csv_scores:
-                            st.info(f"📊 **CSV Verification:** Score: {csv_scores['score']}/{csv_scores['total_possible']} (Yes: {csv_scores['yes_count']}, No: {csv_scores['no_count']}, Not Sure: {csv_scores['not_sure_count']}) - {csv_scores['score_percentage']:.1f}%")
+                        for vendor_name in results:
+                            # Verify scores by calculating from CSV
+                            csv_scores = evaluator.calculate_scores_from_csv(vendor_name)
+                            if "error" not in csv_scores:
+                                st.info(f"📊 **CSV Verification ({vendor_name}):** Score: {csv_scores['score']}/{csv_scores['total_possible']} (Yes: {csv_scores['yes_count']}, No: {csv_scores['no_count']}, Not Sure: {csv_scores['not_sure_count']}) - {csv_scores['score_percentage']:.1f}%")
                         
                         # Show updated matrix
-                        updated_matrix = evaluator.get_evaluation_matrix()
                         st.subheader("Updated Evaluation Matrix:")
                         st.dataframe(updated_matrix)
                         
@@ -753,12 +1648,9 @@ def main():
                             file_name="evaluation_matrix.csv",
                             mime="text/csv"
                         )
-                    else:
-                        st.error("Could not extract text from the uploaded PDF.")
     
     # Footer
-    st.markdown("---")
-    st.markdown("**Note:** This application uses Amazon Bedrock LLM for document analysis and evaluation.")
+    st.markdown("---\n\n**Note:** This application uses Amazon Bedrock LLM for document analysis and evaluation.")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,147 @@
+"""
+Shared mock data for the Vendor Evaluation Tool.
+Used by the demo app and the programmatic usage example.
+"""
+
+MOCK_RFP_TEXT = """
+REQUEST FOR PROPOSAL: ENTERPRISE SOFTWARE SOLUTION
+
+We are seeking proposals for an enterprise software solution that meets the following requirements:
+
+Technical Requirements:
+- Must support single sign-on (SSO) with SAML 2.0
+- Must provide REST API for integration
+- Must support multi-tenant architecture
+- Must be deployable on-premise or in the cloud
+- Must provide real-time data synchronization
+
+Security Requirements:
+- Data must be encrypted at rest using AES-256
+- Must support role-based access control (RBAC)
+- Must provide audit logging for all user actions
+- Must comply with SOC 2 Type II standards
+
+Support Requirements:
+- Must provide 24/7 technical support via phone and email
+- Must offer training and documentation
+- Must provide implementation services
+- Must offer maintenance and updates
+
+Performance Requirements:
+- Must support at least 1000 concurrent users
+- Must have 99.9% uptime SLA
+- Must provide response times under 2 seconds
+"""
+
+MOCK_REQUIREMENTS = [
+    "Must support single sign-on (SSO) with SAML 2.0",
+    "Must provide REST API for integration",
+    "Must support multi-tenant architecture",
+    "Must be deployable on-premise or in the cloud",
+    "Must provide real-time data synchronization",
+    "Data must be encrypted at rest using AES-256",
+    "Must support role-based access control (RBAC)",
+    "Must provide audit logging for all user actions",
+    "Must comply with SOC 2 Type II standards",
+    "Must provide 24/7 technical support via phone and email",
+    "Must offer training and documentation",
+    "Must provide implementation services",
+    "Must offer maintenance and updates",
+    "Must support at least 1000 concurrent users",
+    "Must have 99.9% uptime SLA",
+    "Must provide response times under 2 seconds"
+]
+
+MOCK_VENDOR_A_EVALUATIONS = {
+    "Must support single sign-on (SSO) with SAML 2.0": "Yes",
+    "Must provide REST API for integration": "Yes",
+    "Must support multi-tenant architecture": "Yes",
+    "Must be deployable on-premise or in the cloud": "Yes",
+    "Must provide real-time data synchronization": "Yes",
+    "Data must be encrypted at rest using AES-256": "Yes",
+    "Must support role-based access control (RBAC)": "Yes",
+    "Must provide audit logging for all user actions": "Yes",
+    "Must comply with SOC 2 Type II standards": "Yes",
+    "Must provide 24/7 technical support via phone and email": "Yes",
+    "Must offer training and documentation": "Yes",
+    "Must provide implementation services": "Yes",
+    "Must offer maintenance and updates": "Yes",
+    "Must support at least 1000 concurrent users": "Yes",
+    "Must have 99.9% uptime SLA": "Yes",
+    "Must provide response times under 2 seconds": "Yes"
+}
+
+MOCK_VENDOR_B_EVALUATIONS = {
+    "Must support single sign-on (SSO) with SAML 2.0": "Yes",
+    "Must provide REST API for integration": "Yes",
+    "Must support multi-tenant architecture": "Yes",
+    "Must be deployable on-premise or in the cloud": "No",
+    "Must provide real-time data synchronization": "No",
+    "Data must be encrypted at rest using AES-256": "Yes",
+    "Must support role-based access control (RBAC)": "Yes",
+    "Must provide audit logging for all user actions": "No",
+    "Must comply with SOC 2 Type II standards": "No",
+    "Must provide 24/7 technical support via phone and email": "No",
+    "Must offer training and documentation": "Yes",
+    "Must provide implementation services": "No",
+    "Must offer maintenance and updates": "Yes",
+    "Must support at least 1000 concurrent users": "No",
+    "Must have 99.9% uptime SLA": "No",
+    "Must provide response times under 2 seconds": "No"
+}
+
+MOCK_VENDOR_A_PROPOSAL = """
+VENDOR A PROPOSAL
+
+Technical Capabilities:
+- We provide comprehensive SSO support including SAML 2.0 integration
+- Our platform offers a complete REST API suite for seamless integration
+- Multi-tenant architecture is a core feature of our solution
+- We support both cloud and on-premise deployment options
+- Real-time data synchronization is available through our platform
+
+Security Features:
+- All data is encrypted using AES-256 encryption at rest
+- We implement comprehensive RBAC with granular permissions
+- Complete audit logging is provided for compliance
+- Our solution is SOC 2 Type II certified
+
+Support Services:
+- 24/7 technical support available via phone and email
+- Comprehensive training programs and documentation
+- Professional implementation services included
+- Regular maintenance and updates provided
+
+Performance:
+- Supports up to 2000 concurrent users
+- 99.95% uptime SLA guaranteed
+- Average response time of 1.5 seconds
+"""
+
+MOCK_VENDOR_B_PROPOSAL = """
+VENDOR B PROPOSAL
+
+Technical Capabilities:
+- SSO support with SAML 2.0 available
+- REST API provided for integrations
+- Multi-tenant architecture supported
+- Cloud deployment only (no on-premise option)
+- Batch data processing (not real-time)
+
+Security Features:
+- AES-256 encryption for data at rest
+- Basic role-based access control
+- Limited audit logging capabilities
+- Working towards SOC 2 compliance
+
+Support Services:
+- Business hours support only (8 AM - 6 PM EST)
+- Basic documentation provided
+- Self-service implementation
+- Quarterly updates
+
+Performance:
+- Supports up to 500 concurrent users
+- 99% uptime SLA
+- Response times vary (2-5 seconds)
+"""
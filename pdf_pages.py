@@ -0,0 +1,26 @@
+"""
+PDF page extraction for worker processes.
+Kept separate from main.py so spawned processes can import it without Streamlit.
+"""
+
+from typing import List
+
+import pymupdf
+
+
+def extract_page_range(pdf_bytes: bytes, start: int, stop: int, max_chars: int = 0) -> List[str]:
+    """Return the text of pages start..stop-1 of the PDF, in order.
+    
+    With max_chars, stops loading pages once the range has that many characters.
+    """
+    # Each process opens its own document; PyMuPDF objects are not shared across threads
+    pages = []
+    total = 0
+    with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+        for page_number in range(start, stop):
+            page_text = doc.load_page(page_number).get_text("text")
+            pages.append(page_text)
+            total += len(page_text)
+            if max_chars and total >= max_chars:
+                break
+    return pages
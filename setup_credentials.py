@@ -108,8 +108,9 @@ def test_credentials(access_key, secret_key, session_token, region):
         
         # Test Bedrock access
         bedrock = session.client('bedrock', region_name=region)
-        models = bedrock.list_foundation_models()
-        print(f"   ✅ Bedrock access confirmed - {len(models.get('modelSummaries', []))} models available")
+        # Filtered to the provider the tool uses: a much smaller response than the full catalog
+        models = bedrock.list_foundation_models(byProvider="Anthropic")
+        print(f"   ✅ Bedrock access confirmed - {len(models.get('modelSummaries', []))} Anthropic models available")
         
         return True
         
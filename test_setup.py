@@ -95,8 +95,9 @@ def test_aws_configuration():
         # Test if we can list models (this requires Bedrock access)
         try:
             bedrock_models = session.client('bedrock', region_name=region)
-            models = bedrock_models.list_foundation_models()
-            print(f"✓ Bedrock access confirmed - {len(models.get('modelSummaries', []))} models available")
+            # Filtered to the provider the tool uses: a much smaller response than the full catalog
+            models = bedrock_models.list_foundation_models(byProvider="Anthropic")
+            print(f"✓ Bedrock access confirmed - {len(models.get('modelSummaries', []))} Anthropic models available")
             return True
         except Exception as e:
             print(f"✗ Bedrock access test failed: {e}")
@@ -113,6 +114,11 @@ def test_pdf_processing():
         import PyPDF2
         print("\nTesting PDF processing...")
         print("✓ PyPDF2 imported successfully")
+        try:
+            import pymupdf
+            print("✓ PyMuPDF imported successfully (fast extraction enabled)")
+        except ImportError:
+            print("! PyMuPDF not installed - falling back to PyPDF2 for extraction")
         return True
     except Exception as e:
         print(f"✗ PDF processing test failed: {e}")